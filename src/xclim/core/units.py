@@ -1089,7 +1089,8 @@ def _flux_and_rate_converter(
         out_u = in_u * density_u**density_exp
 
     density_conv = convert_units_to(density, (out_u / in_u) ** density_exp)
-    out: xr.DataArray = (da * density_conv**density_exp).assign_attrs(da.attrs)
+    # Multiply or divide directly, a power of an array density would be an additional pass over the data
+    out: xr.DataArray = (da * density_conv if density_exp == 1 else da / density_conv).assign_attrs(da.attrs)
     out = out.assign_attrs(units=pint2cfunits(out_u))
     if "standard_name" in out.attrs.keys():
         out.attrs.pop("standard_name")
@@ -1232,7 +1233,8 @@ def check_units(val: str | xr.DataArray | None, dim: str | xr.DataArray | None =
     # Should be resolved in pint v0.24. See: https://github.com/hgrecco/pint/issues/1913
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=DeprecationWarning)
-        if str(val).startswith("UNSET "):
+        # Only strings can be unset, str() would format the whole array of a DataArray
+        if isinstance(val, str) and val.startswith("UNSET "):
             warnings.warn(
                 "This index calculation will soon require user-specified thresholds.",
                 FutureWarning,
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import warnings
-from typing import Literal, cast
+from datetime import timedelta
+from functools import lru_cache
+from typing import Literal
 
 import numpy as np
 import xarray
+from numba import boolean, float32, float64, guvectorize, int64, njit, vectorize
+from scipy.ndimage import convolve1d
 from scipy.stats import rv_continuous
 
-import xclim.indices.run_length as rl
+try:
+    from flox.xarray import rechunk_for_blockwise
+except ImportError:
+    rechunk_for_blockwise = None
+
 from xclim.core import DateStr, DayOfYearStr, Quantified
 from xclim.core.calendar import parse_offset, select_time
 from xclim.core.units import (
@@ -18,6 +26,8 @@ from xclim.core.units import (
     declare_units,
     rate2amount,
     to_agg_units,
+    units,
+    units2pint,
 )
 from xclim.core.utils import uses_dask
 from xclim.indices._conversion import potential_evapotranspiration
@@ -62,6 +72,26 @@ __all__ = [
 ]
 
 
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32)",
+        "float64(float64, float64, float64, float64)",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _corn_heat_units(tasmin, tasmax, thresh_tasmin, thresh_tasmax):
+    """Daily corn heat units, fused in a single pass. See :py:func:`corn_heat_units`."""
+    yn = 0.0
+    if tasmin > thresh_tasmin:
+        yn = 1.8 * (tasmin - thresh_tasmin)
+    yx = 0.0
+    if tasmax > thresh_tasmax:
+        dx = tasmax - thresh_tasmax
+        yx = 3.33 * dx - 0.084 * dx * dx
+    return (yn + yx) / 2
+
+
 @declare_units(
     tasmin="[temperature]",
     tasmax="[temperature]",
@@ -125,25 +155,46 @@ def corn_heat_units(
     """
     tasmin = convert_units_to(tasmin, "degC")
     tasmax = convert_units_to(tasmax, "degC")
-    thresh_tasmin = convert_units_to(thresh_tasmin, "degC")
-    thresh_tasmax = convert_units_to(thresh_tasmax, "degC")
-
-    mask_tasmin = tasmin > thresh_tasmin
-    mask_tasmax = tasmax > thresh_tasmax
-
-    chu: xarray.DataArray = (
-        xarray.where(mask_tasmin, 1.8 * (tasmin - thresh_tasmin), 0)
-        + xarray.where(
-            mask_tasmax,
-            (3.33 * (tasmax - thresh_tasmax) - 0.084 * (tasmax - thresh_tasmax) ** 2),
-            0,
-        )
-    ) / 2
-
-    chu = chu.assign_attrs(units="")
+    # Thresholds are cast to the precision of the inputs, as dask would otherwise promote them to float64
+    dtype = np.result_type(tasmin.dtype, tasmax.dtype, np.float32)
+    thresh_tasmin = dtype.type(convert_units_to(thresh_tasmin, "degC"))
+    thresh_tasmax = dtype.type(convert_units_to(thresh_tasmax, "degC"))
+
+    chu: xarray.DataArray = xarray.apply_ufunc(
+        _corn_heat_units,
+        tasmin,
+        tasmax,
+        thresh_tasmin,
+        thresh_tasmax,
+        input_core_dims=[[], [], [], []],
+        dask="parallelized",
+        output_dtypes=[dtype],
+    )
+    chu = chu.rename(None).assign_attrs(units="")
     return chu
 
 
+@vectorize(
+    [
+        "float32(float32, float32, float32)",
+        "float64(float64, float64, float64)",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _mean_degree_days(tas_low, tas_high, thresh):
+    """
+    Daily degree days of the mean of two temperatures, fused in a single pass.
+
+    See :py:func:`huglin_index` and :py:func:`effective_growing_degree_days`.
+    """
+    dd = (tas_low + tas_high) / 2 - thresh
+    # NaNs are propagated by the comparison
+    if dd < 0:
+        dd = 0.0
+    return dd
+
+
 @declare_units(
     tas="[temperature]",
     tasmax="[temperature]",
@@ -235,18 +286,24 @@ def huglin_index(
 
     _tas = convert_units_to(tas, "degC")
     _tasmax = convert_units_to(tasmax, "degC")
-    _thresh = convert_units_to(thresh, "degC")
+    # The threshold is cast to the precision of the inputs, as dask would otherwise promote it to float64
+    dtype = np.result_type(_tas.dtype, _tasmax.dtype, np.float32)
+    _thresh = dtype.type(convert_units_to(thresh, "degC"))
+    if uses_dask(_tas, _tasmax):
+        _tas, _tasmax = xarray.unify_chunks(_tas, _tasmax)
 
     if lat is None:
         lat = _gather_lat(tas)
 
-    k: int | xarray.DataArray = 1
-    k_aggregated: xarray.DataArray | None = None
+    # The coefficient is applied to the aggregated sums, as it does not depend on the day of the year.
+    k_aggregated: xarray.DataArray
     if (method := method.lower()) in ["huglin", "icclim", "interpolated"]:
         if method == "icclim":
             warnings.warn("Method 'icclim' is deprecated. Use 'stepwise' instead.", DeprecationWarning)
             method = "huglin"
-        k = huglin_day_length_latitude_coefficient(lat, method=method, cap_value=cap_value)
+        k_aggregated = huglin_day_length_latitude_coefficient(lat, method=method, cap_value=cap_value)
+        # Locations with an undefined coefficient have a null sum, as their daily values would be skipped.
+        k_aggregated = k_aggregated.fillna(0)
     elif method.lower() == "jones":
         k_aggregated = jones_day_length_latitude_coefficient(
             dates=tas.time, lat=lat, method=method, start_date=start_date, end_date=end_date, freq=freq
@@ -256,15 +313,57 @@ def huglin_index(
             "Method is not implemented. Only 'huglin', 'icclim', 'interpolated', and 'jones' are supported."
         )
 
-    hi: xarray.DataArray = (((_tas + _tasmax) / 2) - _thresh).clip(min=0) * k
-    hi = select_time(hi, date_bounds=(start_date, end_date), include_bounds=(True, False)).resample(time=freq).sum()
-    if k_aggregated is not None:
-        hi = hi * k_aggregated
+    # Only compute the daily values within the season
+    season = select_time(tas.time, drop=True, date_bounds=(start_date, end_date), include_bounds=(True, False))
+    hi: xarray.DataArray = xarray.apply_ufunc(
+        _mean_degree_days,
+        _tas.sel(time=season),
+        _tasmax.sel(time=season),
+        _thresh,
+        input_core_dims=[[]] * 3,
+        dask="parallelized",
+        output_dtypes=[dtype],
+    )
+    if uses_dask(hi) and rechunk_for_blockwise is not None:
+        # Align the chunks on the periods, so the sum is a blockwise reduction
+        labels = xarray.full_like(hi.time, -1, dtype=np.int32)
+        for lbl, group_slice in enumerate(hi.time.resample(time=freq).groups.values()):
+            labels[group_slice] = lbl
+        hi = rechunk_for_blockwise(hi, "time", labels)
+    hi = hi.resample(time=freq).sum()
+    # Periods without any day within the season have a null sum, those without any data are null
+    counts = tas.time.resample(time=freq).count()
+    hi = hi.reindex(time=counts.time).fillna(0).where(counts > 0)
+    hi = hi * k_aggregated
     hi = hi.assign_attrs(units="")
 
     return hi
 
 
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32, float32, float32, float32)",
+        "float64(float64, float64, float64, float64, float64, float64, float64)",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _biologically_effective_degree_days(tasmin, tasmax, k, thresh_tasmin, low_dtr, high_dtr, max_daily_degree_days):
+    """Daily biologically effective degree days, fused in a single pass. See :py:func:`biologically_effective_degree_days`."""
+    # Temperature range adjustment, branchless form of the piecewise function (low_dtr <= high_dtr)
+    dtr = tasmax - tasmin
+    tr_adj = 0.25 * (max(dtr - high_dtr, 0.0) + min(dtr - low_dtr, 0.0))
+
+    # NaNs are propagated by the comparisons below.
+    dd = (tasmin + tasmax) / 2 - thresh_tasmin
+    if dd < 0:
+        dd = 0.0
+    dd = dd * k + tr_adj
+    if dd > max_daily_degree_days:
+        dd = max_daily_degree_days
+    return dd
+
+
 @declare_units(
     tasmin="[temperature]",
     tasmax="[temperature]",
@@ -394,10 +493,14 @@ def biologically_effective_degree_days(
 
     _tasmin = convert_units_to(tasmin, "degC")
     _tasmax = convert_units_to(tasmax, "degC")
-    thresh_tasmin_deg = convert_units_to(thresh_tasmin, "degC")
-    max_daily_degree_days = convert_units_to(max_daily_degree_days, "degC")
-
-    k: int | xarray.DataArray = 1
+    if uses_dask(_tasmin, _tasmax):
+        _tasmin, _tasmax = xarray.unify_chunks(_tasmin, _tasmax)
+    # Thresholds are cast to the precision of the inputs, as dask would otherwise promote them to float64
+    dtype = np.result_type(_tasmin.dtype, _tasmax.dtype, np.float32)
+    thresh_tasmin_deg = dtype.type(convert_units_to(thresh_tasmin, "degC"))
+    max_daily_degree_days = dtype.type(convert_units_to(max_daily_degree_days, "degC"))
+
+    k: np.floating | xarray.DataArray = dtype.type(1)
     k_aggregated: xarray.DataArray | None = None
     if method.lower() == "icclim":
         if lat is not None:
@@ -405,17 +508,13 @@ def biologically_effective_degree_days(
                 "Lat coordinate is not used for method 'icclim' in 'biologically_effective_degree_days' calculation.",
                 UserWarning,
             )
-        tr_adj = 0
+        # No temperature range adjustment
+        low_dtr = dtype.type(-np.inf)
+        high_dtr = dtype.type(np.inf)
     elif method in ["gladstones", "huglin", "interpolated", "jones"]:
         # Temperature range adjustment
-        low_dtr = convert_units_to(low_dtr, "degC")
-        high_dtr = convert_units_to(high_dtr, "degC")
-        dtr = _tasmax - _tasmin
-        tr_adj = 0.25 * xarray.where(
-            dtr > high_dtr,
-            dtr - high_dtr,
-            xarray.where(dtr < low_dtr, dtr - low_dtr, 0),
-        )
+        low_dtr = dtype.type(convert_units_to(low_dtr, "degC"))
+        high_dtr = dtype.type(convert_units_to(high_dtr, "degC"))
 
         if lat is None:
             lat = _gather_lat(tasmin)
@@ -434,13 +533,41 @@ def biologically_effective_degree_days(
             "Method is not implemented. Only 'gladstones', 'huglin', 'icclim', 'interpolated', and 'jones' are supported."
         )
 
-    bedd: xarray.DataArray = ((((_tasmin + _tasmax) / 2) - thresh_tasmin_deg).clip(min=0) * k + tr_adj).clip(
-        max=max_daily_degree_days
+    # Only compute the daily values within the season
+    season = select_time(tasmin.time, drop=True, date_bounds=(start_date, end_date), include_bounds=(True, False))
+    _tasmin, _tasmax = _tasmin.sel(time=season), _tasmax.sel(time=season)
+    if isinstance(k, xarray.DataArray):
+        if "time" in k.dims:
+            k = k.sel(time=season)
+        # Keep the daily values in the precision of the inputs (e.g. float32)
+        k = k.astype(dtype)
+
+    bedd: xarray.DataArray = xarray.apply_ufunc(
+        _biologically_effective_degree_days,
+        _tasmin,
+        _tasmax,
+        k,
+        thresh_tasmin_deg,
+        low_dtr,
+        high_dtr,
+        max_daily_degree_days,
+        input_core_dims=[[]] * 7,
+        dask="parallelized",
+        output_dtypes=[dtype],
     )
-    bedd = select_time(bedd, date_bounds=(start_date, end_date), include_bounds=(True, False)).resample(time=freq).sum()
+    if uses_dask(bedd) and rechunk_for_blockwise is not None:
+        # Align the chunks on the periods, so the sum is a blockwise reduction
+        labels = xarray.full_like(bedd.time, -1, dtype=np.int32)
+        for lbl, group_slice in enumerate(bedd.time.resample(time=freq).groups.values()):
+            labels[group_slice] = lbl
+        bedd = rechunk_for_blockwise(bedd, "time", labels)
+    bedd = bedd.resample(time=freq).sum()
+    # Periods without any day within the season have a null sum, those without any data are null
+    counts = tasmin.time.resample(time=freq).count()
+    bedd = bedd.reindex(time=counts.time).fillna(0).where(counts > 0)
     if k_aggregated is not None:
         bedd = bedd * k_aggregated
-    bedd = bedd.assign_attrs(units="K days")
+    bedd = bedd.rename(None).assign_attrs(units="K days")
 
     return bedd
 
@@ -523,13 +650,52 @@ def cool_night_index(
     else:
         raise ValueError("Latitude must be a DataArray or str ('north' or 'south').")
 
-    tasmin = tasmin.where(months == month, drop=True)
+    # Select the months of interest on the time coordinate only, then mask the other hemisphere, if needed.
+    tasmin = tasmin.isel(time=months.isin(np.unique(month)).values)
+    if isinstance(month, xarray.DataArray):
+        tasmin = tasmin.where(tasmin.time.dt.month == month)
 
     cni: xarray.DataArray = tasmin.resample(time=freq).mean(keep_attrs=True)
     cni = cni.assign_attrs(units="degC")
     return cni
 
 
+# Different potential evapotranspiration rates for northern hemisphere and southern hemisphere in dryness_index.
+_DRYNESS_INDEX_ADJUSTMENT_NORTH = xarray.DataArray(
+    [0, 0, 0, 0.1, 0.3, 0.5, 0.5, 0.5, 0.5, 0, 0, 0],
+    dims="month",
+    coords={"month": np.arange(1, 13)},
+)
+_DRYNESS_INDEX_ADJUSTMENT_SOUTH = xarray.DataArray(
+    [0.5, 0.5, 0.5, 0, 0, 0, 0, 0, 0, 0.1, 0.3, 0.5],
+    dims="month",
+    coords={"month": np.arange(1, 13)},
+)
+
+
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32)",
+        "float64(float64, float64, float64, float64)",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _dryness_index_monthly_balance(pr, evspsblpot, k, daysinmonth):
+    """Monthly water balance of the dryness index, fused in a single pass. See :py:func:`dryness_index`."""
+    # Drop all pr outside seasonal bounds
+    if k <= 0:
+        pr = pr * 0.0
+    # Potential transpiration of the vineyard
+    t_v = evspsblpot * k
+    # Direct soil evaporation
+    jpm = pr / 5
+    if jpm > daysinmonth:
+        jpm = daysinmonth
+    e_s = (evspsblpot / daysinmonth) * (1 - k) * jpm
+    return pr - t_v - e_s
+
+
 @declare_units(pr="[precipitation]", evspsblpot="[precipitation]", wo="[length]")
 def dryness_index(  # numpydoc ignore=SS05
     pr: xarray.DataArray,
@@ -642,90 +808,108 @@ def dryness_index(  # numpydoc ignore=SS05
         raise ValueError(f"Freq not allowed: {freq}. Must be `YS` or `YS-JAN`")
 
     # Resample all variables to monthly totals in mm units.
-    evspsblpot = amount2lwethickness(rate2amount(evspsblpot), out_units="mm").resample(time="MS").sum()
-    pr = amount2lwethickness(rate2amount(pr), out_units="mm").resample(time="MS").sum()
+    evspsblpot = _monthly_lwethickness(evspsblpot)
+    pr = _monthly_lwethickness(pr)
     wo = convert_units_to(wo, "mm")
 
-    # Different potential evapotranspiration rates for northern hemisphere and southern hemisphere.
-    # wo_adjustment is the initial soil moisture rate at beginning of season.
-    adjustment_array_north = xarray.DataArray(
-        [0, 0, 0, 0.1, 0.3, 0.5, 0.5, 0.5, 0.5, 0, 0, 0],
-        dims="month",
-        coords={"month": np.arange(1, 13)},
-    )
-    adjustment_array_south = xarray.DataArray(
-        [0.5, 0.5, 0.5, 0, 0, 0, 0, 0, 0, 0.1, 0.3, 0.5],
-        dims="month",
-        coords={"month": np.arange(1, 13)},
-    )
-
     has_north, has_south = False, False
     if lat is None:
         lat = _gather_lat(pr)
     if isinstance(lat, xarray.DataArray):
-        if (lat >= 0).any():
-            has_north = True
-        if (lat < 0).any():
-            has_south = True
+        # Latitudes are loaded once. The hemisphere flags and the adjustment weights are then evaluated eagerly,
+        # and the weights are broadcast against each chunk of the inputs without any rechunking.
+        lat = lat.copy(data=np.asarray(lat))
+        has_north = bool((lat >= 0).any())
+        has_south = bool((lat < 0).any())
 
         adjustment = xarray.where(
             lat >= 0,
-            adjustment_array_north,
-            adjustment_array_south,
+            _DRYNESS_INDEX_ADJUSTMENT_NORTH,
+            _DRYNESS_INDEX_ADJUSTMENT_SOUTH,
         )
     elif isinstance(lat, str):
         if lat.lower() == "north":
-            adjustment = adjustment_array_north
+            adjustment = _DRYNESS_INDEX_ADJUSTMENT_NORTH
             has_north = True
         elif lat.lower() == "south":
-            adjustment = adjustment_array_south
+            adjustment = _DRYNESS_INDEX_ADJUSTMENT_SOUTH
             has_south = True
         else:
             raise ValueError(f"Latitude value not implemented: {lat}.")
     else:
         raise ValueError("Latitude must be a DataArray or str ('north' or 'south').")
 
-    # Monthly weights array
-    k = adjustment.sel(month=evspsblpot.time.dt.month)
-
-    # Drop all pr outside seasonal bounds
-    pr_masked = (k > 0) * pr
-
-    # Potential transpiration of the vineyard
-    t_v = evspsblpot * k
+    # Monthly weights array, positional lookup in the (month, ...) adjustment table
+    k = adjustment.isel(month=evspsblpot.time.dt.month - 1)
 
-    # Direct soil evaporation
-    e_s = (
-        (evspsblpot / evspsblpot.time.dt.daysinmonth)
-        * (1 - k)
-        * (pr_masked / 5).clip(max=evspsblpot.time.dt.daysinmonth)
+    # Monthly water balance
+    balance = xarray.apply_ufunc(
+        _dryness_index_monthly_balance,
+        pr,
+        evspsblpot,
+        k,
+        evspsblpot.time.dt.daysinmonth,
+        input_core_dims=[[]] * 4,
+        dask="parallelized",
+        keep_attrs=False,
     )
 
-    di_north: xarray.DataArray | None = None
-    di_south: xarray.DataArray | None = None
-    # Dryness index
-    if has_north:
-        di_north = wo + (pr_masked - t_v - e_s).resample(time="YS-JAN").sum()
-    if has_south:
-        di_south = wo + (pr_masked - t_v - e_s).resample(time="YS-JUL").sum()
-        # Shift time for Southern Hemisphere to allow for concatenation with Northern Hemisphere
-        di_south = di_south.shift(time=1).isel(time=slice(1, None))
-        di_south["time"] = di_south.indexes["time"].shift(-6, "MS")
-
-    di: xarray.DataArray
-    if has_north and has_south:
-        di = di_north.where(lat >= 0, di_south)
-    elif has_north:
-        di = di_north  # noqa
-    elif has_south:
-        di = di_south  # noqa
-    else:
+    if not (has_north or has_south):
         raise ValueError("No hemisphere data found.")
+    last = balance.indexes["time"][-1]
+    if has_south:
+        # Shift the Southern Hemisphere season (October to March) by three months, so that it falls within the
+        # calendar year in which it ends. Both hemispheres can then be aggregated with a single resampling.
+        # The series is extended by the shift, so that a season ending after the last month of a year is kept.
+        balance_south = balance.assign_coords(time=balance.indexes["time"].shift(3, "MS"))
+        if has_north:
+            balance, balance_south = xarray.align(balance, balance_south, join="outer")
+            balance = balance.where(lat >= 0, balance_south)
+        else:
+            balance = balance_south
 
-    di = di.assign_attrs(units="mm")
+    # Dryness index, over the years of the inputs
+    di: xarray.DataArray = wo + balance.resample(time="YS-JAN").sum().sel(time=slice(None, last))
+    di = di.rename(None).assign_attrs(units="mm")
     return di
 
 
+@njit(cache=True)
+def _max_monthly_mean(arr, month_starts, month_periods, nperiods):  # pragma: no cover
+    """Maximum of the monthly means of a (time, space) array over each period. See :py:func:`latitude_temperature_index`."""
+    n, npoints = arr.shape
+    out = np.full((nperiods, npoints), np.nan, dtype=arr.dtype)
+    total = np.empty(npoints, dtype=np.float64)
+    count = np.empty(npoints, dtype=np.int64)
+    for m in range(month_starts.shape[0]):
+        end = month_starts[m + 1] if m + 1 < month_starts.shape[0] else n
+        total[:] = 0
+        count[:] = 0
+        # Time steps are the outer loop, so the array is read in memory order
+        for i in range(month_starts[m], end):
+            for j in range(npoints):
+                if not np.isnan(arr[i, j]):
+                    total[j] += arr[i, j]
+                    count[j] += 1
+        p = month_periods[m]
+        for j in range(npoints):
+            if count[j] > 0:
+                mean = total[j] / count[j]
+                if not out[p, j] >= mean:
+                    out[p, j] = mean
+    return out
+
+
+def _max_monthly_mean_ufunc(arr, month_starts, month_periods, nperiods):
+    """Apply :py:func:`_max_monthly_mean` on an array with time on the last axis."""
+    # Moving time back to the first axis restores the memory layout of the usual (time, ...) arrays
+    data = np.moveaxis(arr, -1, 0)
+    out = _max_monthly_mean(
+        np.ascontiguousarray(data).reshape(data.shape[0], -1), month_starts, month_periods, nperiods
+    )
+    return np.moveaxis(out.reshape((nperiods, *data.shape[1:])), 0, -1)
+
+
 @declare_units(tas="[temperature]", lat="[]")
 def latitude_temperature_index(
     tas: xarray.DataArray,
@@ -775,20 +959,55 @@ def latitude_temperature_index(
     """
     tas = convert_units_to(tas, "degC")
 
-    tas = tas.resample(time="MS").mean(dim="time", keep_attrs=True)
-    mtwm = tas.resample(time=freq).max(dim="time", keep_attrs=True)
+    if uses_dask(tas):
+        # Resampling reductions are blockwise, while the single pass below needs the whole series of each point
+        mtwm = tas.resample(time="MS").mean(dim="time", keep_attrs=True)
+        mtwm = mtwm.resample(time=freq).max(dim="time", keep_attrs=True)
+    else:
+        # Monthly means and their maximum over each period are computed in a single pass
+        month_starts = np.array([s.start or 0 for s in tas.time.resample(time="MS").groups.values()], dtype=np.int64)
+        periods = tas.time.resample(time=freq).groups
+        period_starts = [s.start or 0 for s in periods.values()]
+        month_periods = np.searchsorted(period_starts, month_starts, side="right").astype(np.int64) - 1
+        mtwm = xarray.apply_ufunc(
+            _max_monthly_mean_ufunc,
+            tas,
+            input_core_dims=[["time"]],
+            output_core_dims=[["time"]],
+            exclude_dims={"time"},
+            kwargs={"month_starts": month_starts, "month_periods": month_periods, "nperiods": len(periods)},
+            keep_attrs=True,
+        ).assign_coords(time=list(periods.keys()))
+        first, last = tas.indexes["time"][[0, -1]]
+        if month_starts.size < (last.year - first.year) * 12 + last.month - first.month + 1:
+            # Periods without any data are kept, as with a resampling
+            mtwm = mtwm.reindex(time=tas.time.resample(time=freq).first().time)
+        mtwm = mtwm.transpose(*tas.dims)
 
     if lat is None:
         lat = _gather_lat(tas)
 
-    lat_mask = (abs(lat) >= 0) & (abs(lat) <= lat_factor)
-    lat_coeff = xarray.where(lat_mask, lat_factor - abs(lat), 0)
+    # Null poleward of the latitude factor (and for missing latitudes)
+    lat_coeff = np.fmax(lat_factor - abs(lat), 0)
 
     lti: xarray.DataArray = mtwm * lat_coeff
     lti = lti.assign_attrs(units="")
     return lti
 
 
+def _monthly_lwethickness(rate: xarray.DataArray) -> xarray.DataArray:
+    """Monthly totals of a water flux, as a liquid water thickness in mm. See :py:func:`dryness_index`."""
+    # The conversion factor of each time step is computed on the time coordinate alone.
+    factor = amount2lwethickness(
+        rate2amount(xarray.ones_like(rate.time, dtype=float).assign_attrs(units=rate.attrs["units"])),
+        out_units="mm",
+    )
+    if (factor == factor[0]).all():
+        # With a uniform sampling, the monthly sums of the rates are scaled instead of the full series.
+        return rate.resample(time="MS").sum() * factor[0].item()
+    return (rate * factor).resample(time="MS").sum()
+
+
 @declare_units(
     pr="[precipitation]",
     evspsblpot="[precipitation]",
@@ -863,36 +1082,235 @@ def water_budget(
     --------
     xclim.indicators.atmos.potential_evapotranspiration : Potential evapotranspiration calculation.
     """
-    pr = convert_units_to(pr, "kg m-2 s-1", context="hydro")
-
     if lat is None and evspsblpot is None:
         lat = _gather_lat(pr)
 
     if evspsblpot is None:
-        pet = potential_evapotranspiration(
-            tasmin=tasmin,
-            tasmax=tasmax,
-            tas=tas,
-            lat=lat,
-            hurs=hurs,
-            rsds=rsds,
-            rsus=rsus,
-            rlds=rlds,
-            rlus=rlus,
-            sfcWind=sfcWind,
-            method=method,
-        )
+        pet_inputs = {
+            name: da
+            for name, da in {
+                "tasmin": tasmin,
+                "tasmax": tasmax,
+                "tas": tas,
+                "hurs": hurs,
+                "rsds": rsds,
+                "rsus": rsus,
+                "rlds": rlds,
+                "rlus": rlus,
+                "sfcWind": sfcWind,
+            }.items()
+            if da is not None
+        }
+        if uses_dask(*pet_inputs.values()):
+            # Variables read from different files rarely share their chunks. They are aligned and
+            # given common chunks once, instead of being rechunked by each operation combining them.
+            pet_inputs = dict(
+                zip(
+                    pet_inputs,
+                    xarray.unify_chunks(*xarray.align(*pet_inputs.values(), join="inner")),
+                    strict=True,
+                )
+            )
+        pet = potential_evapotranspiration(lat=lat, method=method, **pet_inputs)
     else:
         pet = convert_units_to(evspsblpot, "kg m-2 s-1", context="hydro")
 
-    if xarray.infer_freq(pet.time) == "MS":
+    time = pet.indexes["time"]
+    # Sub-monthly time steps are ruled out on the first two dates, without inferring the frequency of the whole series
+    if (time.size < 3 or time[1] - time[0] >= timedelta(days=28)) and xarray.infer_freq(pet.time) == "MS":
         pr = pr.resample(time="MS").mean(dim="time", keep_attrs=True)
+    # Units are converted after the (optional) monthly resampling, on the smallest array.
+    pr = convert_units_to(pr, "kg m-2 s-1", context="hydro")
+    if np.issubdtype(pr.dtype, np.floating):
+        # The budget is kept in the precision of the precipitation, even if the PET was upcast.
+        pet = pet.astype(pr.dtype)
 
     out: xarray.DataArray = pr - pet
-    out = out.assign_attrs(units=pr.attrs["units"])
+    out = out.assign_attrs(units="kg m-2 s-1")
     return out
 
 
+@lru_cache(maxsize=256)
+def _convert_threshold(thresh: str, target: str) -> float:
+    """Convert a threshold given as a string, caching the result for repeated calls. See :py:func:`rain_season`."""
+    return convert_units_to(thresh, target)
+
+
+@njit(cache=True)
+def _window_total(arr, i, window):  # pragma: no cover
+    """Sum of the `window` values ending at position `i`, NaN if the window is incomplete or holds a NaN."""
+    if i < window - 1:
+        return np.nan
+    s = arr[i - window + 1]
+    for j in range(i - window + 2, i + 1):
+        s += arr[j]
+    return s
+
+
+@njit(cache=True)
+def _compare(value, thresh, below):  # pragma: no cover
+    """Whether `value` is below (or above) or equal to a finite `thresh`, False if it is NaN."""
+    # NaNs are replaced by the infinity failing the comparison, as comparing NaNs raises invalid value warnings
+    # once the loop is vectorized
+    if below:
+        return (np.inf if np.isnan(value) else value) <= thresh
+    return (-np.inf if np.isnan(value) else value) >= thresh
+
+
+@njit(cache=True)
+def _long_run_starts(arr, window):  # pragma: no cover
+    """Flag the first position of each run of true values lasting at least `window` steps."""
+    n = arr.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    run = 0
+    for i in range(n - 1, -1, -1):
+        run = run + 1 if arr[i] else 0
+        out[i] = run >= window and (i == 0 or not arr[i - 1])
+    return out
+
+
+@njit(cache=True)
+def _first_run(run_positions, in_bounds):  # pragma: no cover
+    """Index of the first flagged position within bounds, -1 unless flagged and unflagged positions are found."""
+    first = -1
+    any_false = False
+    for i in range(run_positions.shape[0]):
+        if not in_bounds[i]:
+            continue
+        if run_positions[i]:
+            if first < 0:
+                first = i
+        else:
+            any_false = True
+        if first >= 0 and any_false:
+            return first
+    return -1
+
+
+@njit(cache=True)
+def _rain_season_start(pram, in_search, in_bounds, thresh, options):  # pragma: no cover
+    """Index of the start of the rain season within a period, -1 if none. See :py:func:`rain_season`."""
+    window_wet, window_not_dry, window_dry, _, method_dry, _ = options
+    n = pram.shape[0]
+    x = np.where(in_search, pram, np.nan)
+
+    # First condition: Start with enough precipitation
+    # Second condition: No dry period after. With the "total" method, the dry window starts on the current day.
+    wet = np.zeros(n, dtype=np.bool_)
+    dry = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        wet[i] = _compare(_window_total(x, i, window_wet), thresh[0], False)
+        if method_dry == 0:
+            dry[i] = _compare(x[i], thresh[1], True)
+        elif i + window_dry - 1 < n:
+            dry[i] = _compare(_window_total(x, i + window_dry - 1, window_dry), thresh[1], True)
+    window_stop = window_dry if method_dry == 0 else 1
+
+    # First and second condition combined in a run length: runs start on wet days, and stop on dry spells
+    events = np.zeros(n, dtype=np.bool_)
+    in_run = False
+    dry_spell = 0
+    for i in range(n - 1, -1, -1):
+        dry_spell = dry_spell + 1 if dry[i] else 0
+        events[i] = dry_spell >= window_stop
+    for i in range(n):
+        if events[i]:
+            in_run = False
+        elif wet[i]:
+            in_run = True
+        events[i] = in_run
+    return _first_run(_long_run_starts(events, window_not_dry + window_wet), in_bounds)
+
+
+@njit(cache=True)
+def _rain_season_end(pram, start, in_bounds, thresh, options):  # pragma: no cover
+    """Index of the end of the rain season within a period, -1 if none. See :py:func:`rain_season`."""
+    _, _, _, window_dry, _, method_dry = options
+    n = pram.shape[0]
+    if start < 0:
+        return -1
+    # The end of season is searched after its start
+    x = pram.copy()
+    x[: start + 1] = np.nan
+    run_positions = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        run_positions[i] = _compare(x[i] if method_dry == 0 else _window_total(x, i, window_dry), thresh[2], True)
+    if method_dry == 0:
+        run_positions = _long_run_starts(run_positions, window_dry)
+    return _first_run(run_positions, in_bounds)
+
+
+@guvectorize(
+    [
+        (
+            float32[:],
+            boolean[:],
+            boolean[:],
+            boolean[:],
+            int64[:],
+            int64[:],
+            int64[:],
+            float32,
+            float32,
+            float32,
+            int64[:],
+            float64[:],
+            float64[:],
+            float64[:],
+        ),
+        (
+            float64[:],
+            boolean[:],
+            boolean[:],
+            boolean[:],
+            int64[:],
+            int64[:],
+            int64[:],
+            float64,
+            float64,
+            float64,
+            int64[:],
+            float64[:],
+            float64[:],
+            float64[:],
+        ),
+    ],
+    "(n),(n),(n),(n),(n),(m),(m),(),(),(),(l)->(m),(m),(m)",
+    nopython=True,
+    cache=True,
+)
+def _rain_season(
+    pram,
+    in_search,
+    in_start,
+    in_end,
+    doy,
+    period_start,
+    period_end,
+    thresh_wet_start,
+    thresh_dry_start,
+    thresh_dry_end,
+    options,
+    start,
+    end,
+    length,
+):  # pragma: no cover
+    """Start, end and length of the rain season of each period, in a single pass. See :py:func:`rain_season`."""
+    thresh = (thresh_wet_start, thresh_dry_start, thresh_dry_end)
+    for g in range(period_start.shape[0]):
+        a, b = period_start[g], period_end[g]
+        i_start = _rain_season_start(pram[a:b], in_search[a:b], in_start[a:b], thresh, options)
+        i_end = _rain_season_end(pram[a:b], i_start, in_end[a:b], thresh, options)
+        start[g] = doy[a + i_start] if i_start >= 0 else np.nan
+        end[g] = doy[a + i_end] if i_end >= 0 else np.nan
+        if i_start < 0:
+            length[g] = np.nan
+        elif i_end < 0:
+            length[g] = b - a - i_start
+        else:
+            length[g] = i_end - i_start
+
+
 @declare_units(
     pr="[precipitation]",
     thresh_wet_start="[length]",
@@ -996,96 +1414,91 @@ def rain_season(
     """
     # Unit conversion.
     pram = rate2amount(pr, out_units="mm")
-    thresh_wet_start = convert_units_to(thresh_wet_start, pram)
-    thresh_dry_start = convert_units_to(thresh_dry_start, pram)
-    thresh_dry_end = convert_units_to(thresh_dry_end, pram)
+    # The thresholds can be arrays, they are broadcast against the other dimensions of `pr` by `apply_ufunc`
+    dtype = pram.dtype if pram.dtype == np.float32 else np.dtype(np.float64)
+    thresh = []
+    for t in (thresh_wet_start, thresh_dry_start, thresh_dry_end):
+        t = _convert_threshold(t, pram.attrs["units"]) if isinstance(t, str) else convert_units_to(t, pram)
+        thresh.append(t.astype(dtype) if isinstance(t, xarray.DataArray) else dtype.type(t))
+    methods = {"per_day": 0, "total": 1}
+    if method_dry_start not in methods:
+        raise ValueError(f"Unknown method_dry_start: {method_dry_start}.")
+    if method_dry_end not in methods:
+        raise ValueError(f"Unknown method_dry_end: {method_dry_end}.")
+    options = np.array(
+        [
+            window_wet_start,
+            window_not_dry_start,
+            window_dry_start,
+            window_dry_end,
+            methods[method_dry_start],
+            methods[method_dry_end],
+        ],
+        dtype=np.int64,
+    )
 
+    # Positions of the resampling periods along the time axis
+    periods = pram.time.resample(time=freq).groups
+    labels = list(periods.keys())
+    period_start = np.array([periods[label].start or 0 for label in labels], dtype=np.int64)
+    period_end = np.array([periods[label].stop or pram.time.size for label in labels], dtype=np.int64)
+
+    # Day-of-year masks: the start is searched from `date_min_start` to the end of each period,
+    # but can only be found between `date_min_start` and `date_max_start` (and similarly for the end).
     # should we flag date_min_end  < date_max_start?
-    def _get_first_run(run_positions, start_date, end_date):
-        run_positions = select_time(run_positions, date_bounds=(start_date, end_date))
-        first_start = run_positions.argmax("time")
-        return xarray.where(first_start != run_positions.argmin("time"), first_start, np.nan)
-
-    # Find the start of the rain season
-    def _get_first_run_start(_pram):
-        last_doy = _pram.indexes["time"][-1].strftime("%m-%d")
-        _pram = select_time(_pram, date_bounds=(date_min_start, last_doy))
-
-        # First condition: Start with enough precipitation
-        da_start = _pram.rolling({"time": window_wet_start}).sum() >= thresh_wet_start
-
-        # Second condition: No dry period after
-        if method_dry_start == "per_day":
-            da_stop = _pram <= thresh_dry_start
-            window_dry = window_dry_start
-        elif method_dry_start == "total":
-            da_stop = _pram.rolling({"time": window_dry_start}).sum() <= thresh_dry_start
-            # equivalent to rolling forward in time instead, i.e. end date will be at beginning of dry run
-            da_stop = da_stop.shift({"time": -(window_dry_start - 1)}, fill_value=False)
-            window_dry = 1
-        else:
-            raise ValueError(f"Unknown method_dry_start: {method_dry_start}.")
-
-        # First and second condition combined in a run length
-        events = rl.runs_with_holes(da_start, 1, da_stop, window_dry)
-        run_positions = rl.rle(events) >= (window_not_dry_start + window_wet_start)
-
-        return _get_first_run(run_positions, date_min_start, date_max_start)
-
-    # Find the end of the rain season
-    # FIXME: This function mixes local and parent-level variables. It should be refactored.
-    def _get_first_run_end(_pram):
-        if method_dry_end == "per_day":
-            da_stop = _pram <= thresh_dry_end
-            run_positions = rl.rle(da_stop) >= window_dry_end
-        elif method_dry_end == "total":
-            run_positions = _pram.rolling({"time": window_dry_end}).sum() <= thresh_dry_end
-        else:
-            raise ValueError(f"Unknown method_dry_end: {method_dry_end}.")
-        return _get_first_run(run_positions, date_min_end, date_max_end)
-
-    # Get start, end and length of rain season. Written as a function so it can be resampled
-    # FIXME: This function mixes local and parent-level variables. It should be refactored.
-    def _get_rain_season(_pram):
-        start = _get_first_run_start(_pram)
-
-        # masking value before  start of the season (end of season should be after)
-        # Get valid integer indexer of the day after the first run starts.
-        # `start != NaN` only possible if a condition on next few time steps is respected.
-        # Thus, `start+1` exists if `start != NaN`
-        start_ind = (start + 1).fillna(-1).astype(int)
-        mask = _pram * np.nan
-        # Put "True" on the day of run start
-        mask[{"time": start_ind}] = 1
-        # Mask back points without runs, propagate the True
-        mask = mask.where(start.notnull()).ffill("time")
-        mask = mask.notnull()
-        end = _get_first_run_end(_pram.where(mask))
-
-        length = xarray.where(end.notnull(), end - start, _pram["time"].size - start)
-
-        # converting to doy
-        crd = _pram.time.dt.dayofyear
-        start = rl.lazy_indexing(crd, start)
-        end = rl.lazy_indexing(crd, end)
-
-        _out = xarray.Dataset(
-            {
-                "rain_season_start": start,
-                "rain_season_end": end,
-                "rain_season_length": length,
-            }
-        )
-        return _out
+    ones = xarray.ones_like(pram.time, dtype=np.int8)
+    last_dates = np.full(pram.time.size, "", dtype="<U5")
+    for a, b in zip(period_start, period_end, strict=True):
+        if b > a:
+            last_dates[a:b] = pram.indexes["time"][b - 1].strftime("%m-%d")
+    in_search = np.zeros(pram.time.size, dtype=bool)
+    for last_date in np.unique(last_dates[last_dates != ""]):
+        in_search |= (last_dates == last_date) & select_time(
+            ones, date_bounds=(date_min_start, last_date)
+        ).notnull().values
+    in_search = ones.copy(data=in_search)
+    in_start = select_time(ones, date_bounds=(date_min_start, date_max_start)).notnull()
+    in_end = select_time(ones, date_bounds=(date_min_end, date_max_end)).notnull()
+
+    if uses_dask(pram):
+        pram = pram.chunk(time=-1)
 
     # Compute rain season, attribute units
-    out = cast(xarray.Dataset, pram.resample(time=freq).map(_get_rain_season))
+    out = xarray.apply_ufunc(
+        _rain_season,
+        pram,
+        in_search,
+        in_start,
+        in_end,
+        pram.time.dt.dayofyear.astype(np.int64),
+        xarray.DataArray(period_start, dims=("period",)),
+        xarray.DataArray(period_end, dims=("period",)),
+        *thresh,
+        xarray.DataArray(options, dims=("option",)),
+        input_core_dims=[["time"]] * 5 + [["period"]] * 2 + [[]] * 3 + [["option"]],
+        output_core_dims=[["period"]] * 3,
+        output_dtypes=[np.float64] * 3,
+        dask="parallelized",
+        keep_attrs=False,
+    )
+    out = xarray.Dataset(
+        {
+            name: da.rename(period="time").assign_coords(time=labels).transpose("time", ...)
+            for name, da in zip(["rain_season_start", "rain_season_end", "rain_season_length"], out, strict=True)
+        }
+    )
+    # Periods without any data are not in the groups, they are null as with a resampling
+    out = out.reindex(time=pram.time.resample(time=freq).first().time)
     rain_season_start = out.rain_season_start.assign_attrs(units="", is_dayofyear=np.int32(1))
     rain_season_end = out.rain_season_end.assign_attrs(units="", is_dayofyear=np.int32(1))
     rain_season_length = out.rain_season_length.assign_attrs(units="days")
     return rain_season_start, rain_season_end, rain_season_length
 
 
+# Fitting methods implemented for each distribution given by name, in the standardized indices
+_STANDARDIZED_INDEX_DIST_METHODS = {"gamma": ("ML", "APP"), "fisk": ("ML", "APP")}
+
+
 @declare_units(
     pr="[precipitation]",
     params="[]",
@@ -1158,6 +1571,9 @@ def standardized_precipitation_index(
     * "APP" method only supports two-parameter distributions. Parameter `loc` needs to be fixed to use method `APP`.
     * The results from `climate_indices` library can be reproduced with `method = "APP"` and `fitwkargs = {"floc": 0}`, except for the maximum
       and minimum values allowed which are greater in xclim ±8.21, . See `xclim.indices.stats.standardized_index`
+    * With `dask`, the resampled series are merged into a single chunk along time, as the distributions are fitted
+      on the full calibration period. The computation is parallelized over the other dimensions, which should
+      therefore be the ones chunked.
 
     References
     ----------
@@ -1196,10 +1612,9 @@ def standardized_precipitation_index(
     """
     fitkwargs = fitkwargs or {}
 
-    dist_methods = {"gamma": ["ML", "APP"], "fisk": ["ML", "APP"]}
     if isinstance(dist, str):
-        if dist in dist_methods:
-            if method not in dist_methods[dist]:
+        if dist in _STANDARDIZED_INDEX_DIST_METHODS:
+            if method not in _STANDARDIZED_INDEX_DIST_METHODS[dist]:
                 raise NotImplementedError(f"{method} method is not implemented for {dist} distribution")
         else:
             raise NotImplementedError(f"{dist} distribution is not yet implemented.")
@@ -1291,10 +1706,9 @@ def standardized_precipitation_evapotranspiration_index(
     """
     fitkwargs = fitkwargs or {}
 
-    dist_methods = {"gamma": ["ML", "APP"], "fisk": ["ML", "APP"]}
     if isinstance(dist, str):
-        if dist in dist_methods:
-            if method not in dist_methods[dist]:
+        if dist in _STANDARDIZED_INDEX_DIST_METHODS:
+            if method not in _STANDARDIZED_INDEX_DIST_METHODS[dist]:
                 raise NotImplementedError(f"{method} method is not implemented for {dist} distribution")
         else:
             raise NotImplementedError(f"{dist} distribution is not yet implemented.")
@@ -1355,8 +1769,25 @@ def qian_weighted_mean_average(tas: xarray.DataArray, dim: str = "time") -> xarr
     """
     units = tas.attrs["units"]
 
-    weights = xarray.DataArray([0.0625, 0.25, 0.375, 0.25, 0.0625], dims=["window"])
-    weighted_mean: xarray.DataArray = tas.rolling({dim: 5}, center=True).construct("window").dot(weights)
+    weights = np.array([0.0625, 0.25, 0.375, 0.25, 0.0625])
+    if uses_dask(tas):
+        tas = tas.chunk({dim: -1})
+    # Centered convolution, null where the window is incomplete or holds a null value
+    weighted_mean: xarray.DataArray = xarray.apply_ufunc(
+        convolve1d,
+        tas,
+        input_core_dims=[[dim]],
+        output_core_dims=[[dim]],
+        dask="parallelized",
+        output_dtypes=[np.result_type(tas.dtype, weights.dtype)],
+        kwargs={
+            "weights": weights,
+            "axis": -1,
+            "output": np.result_type(tas.dtype, weights.dtype),
+            "mode": "constant",
+            "cval": np.nan,
+        },
+    ).transpose(*tas.dims)
     weighted_mean = weighted_mean.assign_attrs(units=units)
     return weighted_mean
 
@@ -1426,13 +1857,16 @@ def effective_growing_degree_days(
     ----------
     :cite:cts:`bootsma_impacts_2005`
     """
-    tasmax = convert_units_to(tasmax, "degC")
-    tasmin = convert_units_to(tasmin, "degC")
+    # Temperatures in kelvins or degrees Celsius are used as is, the thresholds are converted instead
+    if units2pint(tasmin) not in (units("K"), units("degC")):
+        tasmin = convert_units_to(tasmin, "degC")
+    tasmax = convert_units_to(tasmax, tasmin)
     thresh = convert_units_to(thresh, "degC")
     thresh_with_units = f"{thresh} degC"
+    dtype = np.result_type(tasmin.dtype, tasmax.dtype, np.float32)
 
     tas = (tasmin + tasmax) / 2
-    tas.attrs["units"] = "degC"
+    tas.attrs["units"] = tasmin.attrs["units"]
 
     if method.lower() == "bootsma":
         fda = first_day_temperature_above(tas=tas, thresh=thresh_with_units, window=1, freq=freq)
@@ -1455,9 +1889,19 @@ def effective_growing_degree_days(
         - 1
     )
 
-    deg_days = (tas - thresh).clip(min=0)
+    deg_days = xarray.apply_ufunc(
+        _mean_degree_days,
+        tasmin,
+        tasmax,
+        # The threshold is cast to the precision of the inputs, as dask would otherwise promote it to float64
+        dtype.type(convert_units_to(thresh_with_units, tasmin)),
+        input_core_dims=[[]] * 3,
+        dask="parallelized",
+        output_dtypes=[dtype],
+    )
     egdd: xarray.DataArray = aggregate_between_dates(deg_days, start=start, end=end, freq=freq)
-    egdd = to_agg_units(egdd, tas, op="integral", deffreq="D")
+    # Degree days are temperature differences, the same in kelvins and in degrees Celsius
+    egdd = to_agg_units(egdd, tas.assign_attrs(units="degC"), op="integral", deffreq="D")
     return egdd
 
 
@@ -1510,14 +1954,17 @@ def hardiness_zones(  # numpydoc ignore=SS05
     return zones
 
 
-def _accumulate_intermediate(prev_E, prev_xi, curr_xs, curr_ak1):
-    """Accumulate the intermediate product based on the previous concentration and the current temperature."""
-    curr_S = np.where(prev_E < 1, prev_E, prev_E - prev_E * prev_xi)
-    return curr_xs - (curr_xs - curr_S) * np.exp(-curr_ak1)
-
-
-def _chill_portion_one_season(tas_K):
-    """Computes the chill portion for a single season based on the dynamic model on a numpy array."""
+@guvectorize(
+    [
+        (float32[:], float32[:]),
+        (float64[:], float64[:]),
+    ],
+    "(n)->()",
+    nopython=True,
+    cache=True,
+)
+def _chill_portion_one_season(tas_K, out):  # pragma: no cover
+    """Computes the chill portion for a single season based on the dynamic model, in a single pass over time."""
     # Constants as described in Luedeling et al. (2009)
     E0 = 4153.5
     E1 = 12888.8
@@ -1528,18 +1975,27 @@ def _chill_portion_one_season(tas_K):
     AA = A0 / A1
     EE = E1 - E0
 
-    ftmprt = SLP * TETMLT * (tas_K - TETMLT) / tas_K
-    sr = np.exp(ftmprt)
-    xi = sr / (1 + sr)
-    xs = AA * np.exp(EE / tas_K)
-    ak1 = A1 * np.exp(-E1 / tas_K)
-
-    inter_E = np.zeros_like(tas_K)
-    for i in range(1, tas_K.shape[-1]):
-        inter_E[..., i] = _accumulate_intermediate(inter_E[..., i - 1], xi[..., i - 1], xs[..., i], ak1[..., i])
-    delta = np.where(inter_E >= 1, inter_E * xi, 0)
-
-    return delta
+    total = 0.0
+    inter_E = 0.0
+    prev_xi = 0.0
+    for i in range(tas_K.shape[0]):
+        ftmprt = SLP * TETMLT * (tas_K[i] - TETMLT) / tas_K[i]
+        sr = np.exp(ftmprt)
+        xi = sr / (1 + sr)
+        if i > 0:
+            # Accumulate the intermediate product based on the previous concentration and the current temperature.
+            xs = AA * np.exp(EE / tas_K[i])
+            ak1 = A1 * np.exp(-E1 / tas_K[i])
+            # NaNs are propagated by the comparison
+            curr_S = inter_E if inter_E < 1 else inter_E - inter_E * prev_xi
+            inter_E = xs - (xs - curr_S) * np.exp(-ak1)
+            # The final product is stable: only the portions completed at each step are summed, skipping NaNs.
+            if inter_E >= 1:
+                delta = inter_E * xi
+                if not np.isnan(delta):
+                    total += delta
+        prev_xi = xi
+    out[0] = total
 
 
 def _apply_chill_portion_one_season(tas_K):
@@ -1547,13 +2003,13 @@ def _apply_chill_portion_one_season(tas_K):
     if uses_dask(tas_K):
         tas_K = tas_K.chunk(time=-1)
     return xarray.apply_ufunc(
-        _chill_portion_one_season,
+        # Copying the data with time as the last axis makes the recurrence read each series contiguously
+        lambda arr: _chill_portion_one_season(np.ascontiguousarray(arr)),
         tas_K,
         input_core_dims=[["time"]],
-        output_core_dims=[["time"]],
         output_dtypes=[tas_K.dtype],
         dask="parallelized",
-    ).sum("time")
+    )
 
 
 @declare_units(tas="[temperature]")
@@ -1611,6 +2067,69 @@ def chill_portions(tas: xarray.DataArray, freq: str = "YS", **indexer) -> xarray
     return resample_map(tas_K, "time", freq, _apply_chill_portion_one_season).assign_attrs(units="")
 
 
+@njit(cache=True)
+def _chill_unit(t, bounds, values):  # pragma: no cover
+    """Chill units of a non-null hourly temperature. See :py:func:`chill_units`."""
+    # Index of the first upper bound that is not exceeded
+    k = 0
+    while k < bounds.shape[0] and t > bounds[k]:
+        k += 1
+    return values[k]
+
+
+@njit(cache=True)
+def _chill_units_sum(
+    arr, bounds, values, block_starts, block_periods, nperiods, positive_only
+):  # pragma: no cover
+    """Sums of the chill units of a (time, space) array of temperatures over each period. See :py:func:`chill_units`."""
+    n, npoints = arr.shape
+    out = np.zeros((nperiods, npoints), dtype=np.float64)
+    total = np.empty(npoints, dtype=np.float64)
+    for b in range(block_starts.shape[0]):
+        end = block_starts[b + 1] if b + 1 < block_starts.shape[0] else n
+        total[:] = 0
+        # Time steps are the outer loop, so the array is read in memory order
+        for i in range(block_starts[b], end):
+            for j in range(npoints):
+                t = arr[i, j]
+                if not np.isnan(t):
+                    total[j] += _chill_unit(t, bounds, values)
+        p = block_periods[b]
+        for j in range(npoints):
+            if not positive_only or total[j] > 0:
+                out[p, j] += total[j]
+    return out
+
+
+@njit(cache=True)
+def _chill_units_hourly(arr, bounds, values):  # pragma: no cover
+    """Chill units of a flat array of hourly temperatures, null where the temperature is. See :py:func:`chill_units`."""
+    out = np.empty(arr.shape, dtype=np.float64)
+    for i in range(arr.shape[0]):
+        out[i] = np.nan if np.isnan(arr[i]) else _chill_unit(arr[i], bounds, values)
+    return out
+
+
+def _chill_units_hourly_ufunc(arr, bounds, values):
+    """Apply :py:func:`_chill_units_hourly` on an array of any shape."""
+    return _chill_units_hourly(np.ascontiguousarray(arr).ravel(), bounds, values).reshape(arr.shape)
+
+
+def _chill_units_sum_ufunc(arr, bounds, values, block_starts, block_periods, nperiods, positive_only):
+    """Apply :py:func:`_chill_units_sum` on an array with time on the last axis."""
+    data = np.moveaxis(arr, -1, 0)
+    out = _chill_units_sum(
+        np.ascontiguousarray(data).reshape(data.shape[0], -1),
+        bounds,
+        values,
+        block_starts,
+        block_periods,
+        nperiods,
+        positive_only,
+    )
+    return np.moveaxis(out.reshape((nperiods, *data.shape[1:])), 0, -1)
+
+
 @declare_units(tas="[temperature]")
 def chill_units(tas: xarray.DataArray, positive_only: bool = False, freq: str = "YS") -> xarray.DataArray:
     """
@@ -1648,22 +2167,56 @@ def chill_units(tas: xarray.DataArray, positive_only: bool = False, freq: str =
     >>> cu = chill_units(tasmin)
     """
     tas = convert_units_to(tas, "degC")
-    cu = xarray.where(
-        (tas <= 1.4) | ((tas > 12.4) & (tas <= 15.9)),
-        0,
-        xarray.where(
-            ((tas > 1.4) & (tas <= 2.4)) | ((tas > 9.1) & (tas <= 12.4)),
-            0.5,
-            xarray.where(
-                (tas > 2.4) & (tas <= 9.1),
-                1,
-                xarray.where((tas > 15.9) & (tas <= 17.9), -0.5, -1),
-            ),
-        ),
-    )
-    cu = cu.where(tas.notnull())
-
+    # Upper bounds of the temperature ranges and their chill units.
+    # The bounds are compared in the precision of the temperatures.
+    cu_bounds = np.array([1.4, 2.4, 9.1, 12.4, 15.9, 17.9], dtype=np.result_type(tas.dtype, np.float32))
+    cu_values = np.array([0, 0.5, 1, 0.5, 0, -0.5, -1], dtype=np.float64)
+
+    if uses_dask(tas):
+        # The hourly chill units are computed blockwise and summed with resampling reductions, as the single pass
+        # below needs the whole series of each point in memory
+        cu = xarray.apply_ufunc(
+            _chill_units_hourly_ufunc,
+            tas,
+            kwargs={"bounds": cu_bounds, "values": cu_values},
+            output_dtypes=[cu_values.dtype],
+            dask="parallelized",
+            keep_attrs=False,
+        )
+        if positive_only:
+            daily = cu.resample(time="1D").sum()
+            cu = daily.where(daily > 0)
+        return cu.resample(time=freq).sum().assign_attrs(units="")
+
+    # The hourly chill units are summed over blocks (days when only positive days count, periods otherwise),
+    # which are accumulated into their period in a single pass
+    periods = tas.time.resample(time=freq).groups
+    period_starts = np.array([s.start or 0 for s in periods.values()], dtype=np.int64)
     if positive_only:
-        daily = cu.resample(time="1D").sum()
-        cu = daily.where(daily > 0)
-    return cu.resample(time=freq).sum().assign_attrs(units="")
+        block_starts = np.array([s.start or 0 for s in tas.time.resample(time="1D").groups.values()], dtype=np.int64)
+        block_periods = np.searchsorted(period_starts, block_starts, side="right").astype(np.int64) - 1
+    else:
+        block_starts = period_starts
+        block_periods = np.arange(period_starts.size, dtype=np.int64)
+    cu = xarray.apply_ufunc(
+        _chill_units_sum_ufunc,
+        tas,
+        input_core_dims=[["time"]],
+        output_core_dims=[["time"]],
+        exclude_dims={"time"},
+        kwargs={
+            "bounds": cu_bounds,
+            "values": cu_values,
+            "block_starts": block_starts,
+            "block_periods": block_periods,
+            "nperiods": len(periods),
+            "positive_only": positive_only,
+        },
+        keep_attrs=False,
+    ).assign_coords(time=list(periods.keys()))
+    full = tas.time.resample(time=freq).first().time
+    if full.size > len(periods):
+        # Periods without any data are kept, as with a resampling. With `positive_only`, the daily resampling
+        # fills them with days without chill units.
+        cu = cu.reindex(time=full, fill_value=0 if positive_only else np.nan)
+    return cu.transpose(*tas.dims).assign_attrs(units="")
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from typing import cast
 
 import numpy as np
 import xarray as xr
-from numba import vectorize
+from numba import float32, float64, guvectorize, njit, vectorize
 
 from xclim.core import Quantified
 from xclim.core.units import (
@@ -15,6 +16,7 @@ from xclim.core.units import (
     declare_units,
     flux2rate,
     rate2flux,
+    units,
     units2pint,
 )
 from xclim.indices.helpers import (
@@ -62,6 +64,27 @@ __all__ = [
     "wind_profile",
 ]
 
+# Powers of 10 are computed as exponentials, which are faster than the generic power functions
+_LN10 = 2.302585092994046  # ln(10)
+_EPS = 0.621981  # R_dry / R_vapor
+_INV_EPS_M1 = 1 / _EPS - 1
+
+
+@vectorize(["float32(float32, float32, float32)", "float64(float64, float64, float64)"], cache=True)
+def _humidex_tdps(tas, tdps, scale):  # pragma: no cover
+    """Return the humidex from the dewpoint temperature (K). See :py:func:`humidex`."""
+    # Vapour pressure in hPa
+    e = 6.112 * np.exp(5417.7530 * (1 / 273.16 - 1.0 / tdps))
+    return tas + 5 / 9 * (e - 10) * scale
+
+
+@vectorize(["float32(float32, float32, float32, float32)", "float64(float64, float64, float64, float64)"], cache=True)
+def _humidex_hurs(tas, tasC, hurs, scale):  # pragma: no cover
+    """Return the humidex from the relative humidity (%). See :py:func:`humidex`."""
+    # Vapour pressure in hPa
+    e = hurs / 100 * 6.112 * np.exp(_LN10 * 7.5 * tasC / (tasC + 237.7))
+    return tas + 5 / 9 * (e - 10) * scale
+
 
 @declare_units(tas="[temperature]", tdps="[temperature]", hurs="[]")
 def humidex(
@@ -134,35 +157,62 @@ def humidex(
     if (tdps is None) and (hurs is None):
         raise ValueError("At least one of `tdps` or `hurs` must be given.")
 
-    # Vapour pressure in hPa
+    # The temperature delta due to humidity is computed in delta_degC, then converted to the delta units of `tas`
+    du = (1 * units2pint(tas) - 0 * units2pint(tas)).units
+    scale = units.Quantity(1, "delta_degree_Celsius").to(du).m
+
+    # The vapour pressure and the temperature delta are computed in a single pass
     if tdps is not None:
         # Convert dewpoint temperature to Kelvins
         tdps = convert_units_to(tdps, "kelvin")
-        e = 6.112 * np.exp(5417.7530 * (1 / 273.16 - 1.0 / tdps))
+        dtype = np.result_type(tas.dtype, tdps.dtype)
+        out: xr.DataArray = xr.apply_ufunc(
+            _humidex_tdps,
+            tas,
+            tdps,
+            dtype.type(scale),
+            dask="parallelized",
+            output_dtypes=[dtype],
+            join="inner",
+        )
 
     elif hurs is not None:
         # Convert dry bulb temperature to Celsius
         tasC = convert_units_to(tas, "celsius")
         hurs = convert_units_to(hurs, "%")
-        e = hurs / 100 * 6.112 * 10 ** (7.5 * tasC / (tasC + 237.7))
+        dtype = np.result_type(tas.dtype, hurs.dtype)
+        out = xr.apply_ufunc(
+            _humidex_hurs,
+            tas,
+            tasC,
+            hurs,
+            dtype.type(scale),
+            dask="parallelized",
+            output_dtypes=[dtype],
+            join="inner",
+        )
 
     else:
         raise ValueError("Either `tdps` or `hurs` must be provided.")
 
-    # Temperature delta due to humidity in delta_degC
-    h: xr.DataArray = 5 / 9 * (e - 10)
-    h = h.assign_attrs(units="delta_degree_Celsius")
-
-    # Get delta_units for output
-    du = (1 * units2pint(tas) - 0 * units2pint(tas)).units
-    h = convert_units_to(h, du)
-
-    # Add the delta to the input temperature
-    out = h + tas
     out = out.assign_attrs(units=tas.units)
     return out
 
 
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], cache=True)
+def _heat_index(t, r):  # pragma: no cover
+    """Return the polynomial of the heat index, in Horner form. See :py:func:`heat_index`."""
+    # The index is only valid above 20°C, NaNs are checked first to avoid invalid value warnings
+    if np.isnan(t) or t <= 20:
+        return np.nan
+    return (
+        -8.78469475556
+        + t * (1.61139411 + t * (-0.012308094 + r * (0.002211732 + r * -0.000003582)))
+        + r * (2.33854883889 + r * -0.0164248277778)
+        + t * r * (-0.14611605 + r * 0.00072546)
+    )
+
+
 @declare_units(tas="[temperature]", hurs="[]")
 def heat_index(tas: xr.DataArray, hurs: xr.DataArray) -> xr.DataArray:
     r"""
@@ -194,21 +244,18 @@ def heat_index(tas: xr.DataArray, hurs: xr.DataArray) -> xr.DataArray:
     ----------
     :cite:cts:`blazejczyk_comparison_2012`
     """
-    thresh = 20  # degC
     t = convert_units_to(tas, "degC")
-    t = t.where(t > thresh)
     r = convert_units_to(hurs, "%")
 
-    out = (
-        -8.78469475556
-        + 1.61139411 * t
-        + 2.33854883889 * r
-        - 0.14611605 * t * r
-        - 0.012308094 * t * t
-        - 0.0164248277778 * r * r
-        + 0.002211732 * t * t * r
-        + 0.00072546 * t * r * r
-        - 0.000003582 * t * t * r * r
+    out: xr.DataArray = xr.apply_ufunc(
+        _heat_index,
+        t,
+        r,
+        dask="parallelized",
+        output_dtypes=[np.result_type(t.dtype, r.dtype)],
+        # Same alignment as arithmetic between DataArrays
+        join="inner",
+        keep_attrs=False,
     )
     out = out.assign_attrs(units="degC")
     return convert_units_to(out, tas.units)
@@ -244,6 +291,26 @@ def tas(tasmin: xr.DataArray, tasmax: xr.DataArray) -> xr.DataArray:
     return tas
 
 
+def _uas_vas_to_sfcwind(uas, vas, wind_thresh):
+    """Wind speed and direction from the wind components (m/s). See :py:func:`uas_vas_to_sfcwind`."""
+    # Wind speed is the hypotenuse of "uas" and "vas"
+    # Wind components are far from overflowing, no need for the slower scaling of np.hypot
+    wind = np.sqrt(uas * uas + vas * vas)
+
+    # Calculate the angle
+    wind_from_dir_math = np.degrees(np.arctan2(vas, uas))
+
+    # Convert the angle from the mathematical standard to the meteorological standard
+    wind_from_dir = (270 - wind_from_dir_math) % 360.0
+
+    # According to the meteorological standard, calm winds must have a direction of 0°
+    # while northerly winds have a direction of 360°
+    # On the Beaufort scale, calm winds are defined as < 0.5 m/s
+    wind_from_dir = np.where(wind_from_dir.round() == 0, 360, wind_from_dir)
+    wind_from_dir = np.where(wind < wind_thresh, 0, wind_from_dir)
+    return wind, wind_from_dir
+
+
 @declare_units(uas="[speed]", vas="[speed]", calm_wind_thresh="[speed]")
 def uas_vas_to_sfcwind(
     uas: xr.DataArray, vas: xr.DataArray, calm_wind_thresh: Quantified = "0.5 m/s"
@@ -287,25 +354,41 @@ def uas_vas_to_sfcwind(
     vas = convert_units_to(vas, "m/s")
     wind_thresh = convert_units_to(calm_wind_thresh, "m/s")
 
-    # Wind speed is the hypotenuse of "uas" and "vas"
-    wind = cast(xr.DataArray, np.hypot(uas, vas))
+    # All the element-wise operations in a single task per chunk
+    dtype = np.result_type(uas.dtype, vas.dtype, np.float32)
+    wind, wind_from_dir = xr.apply_ufunc(
+        _uas_vas_to_sfcwind,
+        uas,
+        vas,
+        dtype.type(wind_thresh),
+        output_core_dims=[[], []],
+        dask="parallelized",
+        output_dtypes=[dtype, dtype],
+        keep_attrs=False,
+        join="inner",
+    )
     wind = wind.assign_attrs(units="m s-1")
-
-    # Calculate the angle
-    wind_from_dir_math = np.degrees(np.arctan2(vas, uas))
-
-    # Convert the angle from the mathematical standard to the meteorological standard
-    wind_from_dir = (270 - wind_from_dir_math) % 360.0
-
-    # According to the meteorological standard, calm winds must have a direction of 0°
-    # while northerly winds have a direction of 360°
-    # On the Beaufort scale, calm winds are defined as < 0.5 m/s
-    wind_from_dir = xr.where(wind_from_dir.round() == 0, 360, wind_from_dir)
-    wind_from_dir = xr.where(wind < wind_thresh, 0, wind_from_dir)
     wind_from_dir.attrs["units"] = "degree"
     return wind, wind_from_dir
 
 
+@guvectorize(
+    [
+        (float32[:], float32[:], float32[:], float32[:]),
+        (float64[:], float64[:], float64[:], float64[:]),
+    ],
+    "(),()->(),()",
+    nopython=True,
+    cache=True,
+)
+def _sfcwind_to_uas_vas(sfcWind, sfcWindfromdir, uas, vas):  # pragma: no cover
+    """Eastward and northward wind components from the wind speed and direction. See :py:func:`sfcwind_to_uas_vas`."""
+    # Converts the wind direction from the meteorological standard to the mathematical standard
+    wind_from_dir_math = np.radians((-sfcWindfromdir[0] + 270) % 360.0)
+    uas[0] = sfcWind[0] * np.cos(wind_from_dir_math)
+    vas[0] = sfcWind[0] * np.sin(wind_from_dir_math)
+
+
 @declare_units(sfcWind="[speed]", sfcWindfromdir="[]")
 def sfcwind_to_uas_vas(
     sfcWind: xr.DataArray,
@@ -338,9 +421,6 @@ def sfcwind_to_uas_vas(
     # Converts the wind speed to m s-1
     sfcWind = convert_units_to(sfcWind, "m/s")  # noqa
 
-    # Converts the wind direction from the meteorological standard to the mathematical standard
-    wind_from_dir_math = (-sfcWindfromdir + 270) % 360.0
-
     # TODO: This commented part should allow us to resample subdaily wind, but needs to be cleaned up and put elsewhere.
     # if resample is not None:
     #     wind = wind.resample(time=resample).mean(dim='time', keep_attrs=True)
@@ -351,11 +431,20 @@ def sfcwind_to_uas_vas(
     #     wind_from_dir_math = np.concatenate([[degrees(phase(sum(rect(1, radians(d)) for d in angles) / len(angles)))]
     #                                       for angles in wind_from_dir_math_per_day])
 
-    uas = sfcWind * np.cos(np.radians(wind_from_dir_math))
-    vas = sfcWind * np.sin(np.radians(wind_from_dir_math))
+    # Converts the wind direction to the mathematical standard and projects the wind speed in a single pass
+    uas, vas = xr.apply_ufunc(
+        _sfcwind_to_uas_vas,
+        sfcWind,
+        sfcWindfromdir,
+        output_core_dims=[[], []],
+        dask="parallelized",
+        output_dtypes=[np.result_type(sfcWind.dtype, sfcWindfromdir.dtype, np.float32)] * 2,
+        join="inner",
+    )
     uas.attrs["units"] = "m s-1"
     vas.attrs["units"] = "m s-1"
-    return uas, vas
+    # The components don't inherit the name of the wind speed
+    return uas.rename(None), vas.rename(None)
 
 
 ESAT_FORMULAS_COEFFICIENTS = {
@@ -378,85 +467,217 @@ Where :math:`T` is the air temperature in K and :math:`T_0` is the freezing temp
 """
 
 
-def _saturation_vapor_pressure_over_water(tas: xr.DataArray, method: str):
-    """Saturation vapor pressure with reference to water."""
-    e_sat: xr.DataArray
-    if method == "ecmwf":
-        method = "buck81"
-    if method == "sonntag90":
-        e_sat = 100 * np.exp(
-            -6096.9385 / tas  # type: ignore
-            + 16.635794
-            + -2.711193e-2 * tas  # type: ignore
-            + 1.673952e-5 * tas**2
-            + 2.433502 * np.log(tas)  # numpy's log is ln
-        )
-    elif method == "goffgratch46":
-        Tb = 373.16  # Water boiling temp [K]
-        eb = 101325  # e_sat at Tb [Pa]
-        e_sat = eb * 10 ** (
-            -7.90298 * ((Tb / tas) - 1)  # type: ignore
-            + 5.02808 * np.log10(Tb / tas)  # type: ignore
-            + -1.3817e-7 * (10 ** (11.344 * (1 - tas / Tb)) - 1)
-            + 8.1328e-3 * (10 ** (-3.49149 * ((Tb / tas) - 1)) - 1)  # type: ignore
-        )
-    elif method == "its90":
-        e_sat = np.exp(
-            -2836.5744 / tas**2
-            + -6028.076559 / tas
-            + 19.54263612
-            + -2.737830188e-2 * tas
-            + 1.6261698e-5 * tas**2
-            + 7.0229056e-10 * tas**3
-            + -1.8680009e-13 * tas**4
-            + 2.7150305 * np.log(tas)
+@njit(cache=True)
+def _sonntag90_water(tas):  # pragma: no cover
+    """Saturation vapor pressure with reference to water, "sonntag90" method."""
+    return 100 * np.exp(
+        -6096.9385 / tas + 16.635794 + tas * (-2.711193e-2 + tas * 1.673952e-5) + 2.433502 * np.log(tas)
+    )
+
+
+@njit(cache=True)
+def _goffgratch46_water(tas):  # pragma: no cover
+    """Saturation vapor pressure with reference to water, "goffgratch46" method."""
+    Tb = 373.16  # Water boiling temp [K]
+    eb = 101325  # e_sat at Tb [Pa]
+    return eb * np.exp(
+        _LN10
+        * (
+            -7.90298 * ((Tb / tas) - 1)
+            + 5.02808 * np.log10(Tb / tas)
+            + -1.3817e-7 * (np.exp(_LN10 * 11.344 * (1 - tas / Tb)) - 1)
+            + 8.1328e-3 * (np.exp(_LN10 * -3.49149 * ((Tb / tas) - 1)) - 1)
         )
-    elif method in ESAT_FORMULAS_COEFFICIENTS:
-        A, B, C = ESAT_FORMULAS_COEFFICIENTS[method]["water"]
-        e_sat = A * np.exp(B * (tas - 273.16) / (tas + C))
+    )
+
+
+@njit(cache=True)
+def _its90_water(tas):  # pragma: no cover
+    """Saturation vapor pressure with reference to water, "its90" method."""
+    return np.exp(
+        (-2836.5744 / tas + -6028.076559) / tas
+        + 19.54263612
+        + tas * (-2.737830188e-2 + tas * (1.6261698e-5 + tas * (7.0229056e-10 + tas * -1.8680009e-13)))
+        + 2.7150305 * np.log(tas)
+    )
+
+
+@njit(cache=True)
+def _sonntag90_ice(tas):  # pragma: no cover
+    """Saturation vapor pressure with reference to ice, "sonntag90" method."""
+    return 100 * np.exp(
+        -6024.5282 / tas + 24.7219 + tas * (1.0613868e-2 + tas * -1.3198825e-5) + -0.49382577 * np.log(tas)
+    )
+
+
+@njit(cache=True)
+def _goffgratch46_ice(tas):  # pragma: no cover
+    """Saturation vapor pressure with reference to ice, "goffgratch46" method."""
+    Tp = 273.16  # Triple-point temperature [K]
+    ep = 611.73  # e_sat at Tp [Pa]
+    return ep * np.exp(
+        _LN10 * (-9.09718 * ((Tp / tas) - 1) + -3.56654 * np.log10(Tp / tas) + 0.876793 * (1 - tas / Tp))
+    )
+
+
+@njit(cache=True)
+def _its90_ice(tas):  # pragma: no cover
+    """Saturation vapor pressure with reference to ice, "its90" method."""
+    return np.exp(
+        -5866.6426 / tas
+        + 22.32870244
+        + tas * (1.39387003e-2 + tas * (-3.4262402e-5 + tas * 2.7040955e-8))
+        + 6.7063522e-1 * np.log(tas)
+    )
+
+
+_ESAT_METHOD_IDS = {"sonntag90": 0, "goffgratch46": 1, "its90": 2}
+"""Integer codes of the saturation vapor pressure methods with compiled formulas, as numba can't dispatch on strings."""
+
+
+@njit(cache=True)
+def _esat_water(tas, method):  # pragma: no cover
+    """Saturation vapor pressure with reference to water of the method with the given code."""
+    if method == 0:
+        return _sonntag90_water(tas)
+    if method == 1:
+        return _goffgratch46_water(tas)
+    return _its90_water(tas)
+
+
+@njit(cache=True)
+def _esat_ice(tas, method):  # pragma: no cover
+    """Saturation vapor pressure with reference to ice of the method with the given code."""
+    if method == 0:
+        return _sonntag90_ice(tas)
+    if method == 1:
+        return _goffgratch46_ice(tas)
+    return _its90_ice(tas)
+
+
+@njit(cache=True)
+def _esat(tas, T_i, T_w, power, mode, method):  # pragma: no cover
+    """
+    Saturation vapor pressure of the method with the given code.
+
+    With `mode` 0, the reference is water. With `mode` 1, it is water above `T_i` and ice below, computing only the
+    one used. With `mode` 2, it is interpolated between ice below `T_i` and water above `T_w`.
+    See :py:func:`saturation_vapor_pressure`.
+    """
+    if mode == 0:
+        return _esat_water(tas, method)
+    if mode == 1:
+        if tas > T_i:
+            return _esat_water(tas, method)
+        return _esat_ice(tas, method)
+    if tas < T_i:
+        return _esat_ice(tas, method)
+    if tas > T_w:
+        return _esat_water(tas, method)
+    alpha = ((tas - T_i) / (T_w - T_i)) ** power
+    return alpha * _esat_water(tas, method) + (1 - alpha) * _esat_ice(tas, method)
+
+
+@vectorize(["float32(float32, int64)", "float64(float64, int64)"], cache=True)
+def _saturation_vapor_pressure_water(tas, method):  # pragma: no cover
+    """Saturation vapor pressure with reference to water of the method with the given code."""
+    return _esat_water(tas, method)
+
+
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32, int64, int64)",
+        "float64(float64, float64, float64, float64, int64, int64)",
+    ],
+    cache=True,
+)
+def _saturation_vapor_pressure(tas, T_i, T_w, power, mode, method):  # pragma: no cover
+    """Saturation vapor pressure of the method with the given code. See :py:func:`_esat`."""
+    return _esat(tas, T_i, T_w, power, mode, method)
+
+
+def _esat_args(
+    method: str,
+    ice_thresh: Quantified | None,
+    interp_power: float | None,
+    water_thresh: Quantified,
+    dtype: np.dtype,
+) -> tuple:
+    """Scalar arguments of the compiled saturation vapor pressure kernels, after the temperature(s)."""
+    if ice_thresh is None and interp_power is None:
+        mode, T_i, T_w, power = 0, np.nan, np.nan, np.nan
+    elif interp_power is None:
+        mode, T_i, T_w, power = 1, convert_units_to(ice_thresh, "K"), np.nan, np.nan
     else:
-        valid = ["sonntag90", "goffgratch46", "its90", "ecmwf"] + list(ESAT_FORMULAS_COEFFICIENTS.keys())
-        raise ValueError(f"Method {method} is not in {valid}")
-    return e_sat
+        mode, T_i, T_w = 2, convert_units_to(ice_thresh, "K"), convert_units_to(water_thresh, "K")
+        power = interp_power
+    # The thresholds are cast to the precision of the temperature, as dask would otherwise promote them
+    return (
+        dtype.type(T_i),
+        dtype.type(T_w),
+        dtype.type(power),
+        np.int64(mode),
+        np.int64(_ESAT_METHOD_IDS[method]),
+    )
+
+
+@njit(cache=True)
+def _invalid_hurs(hurs, invalid):  # pragma: no cover
+    """Keep (0), clip (1) or mask (2) a relative humidity (%) outside of [0, 100]."""
+    # NaNs are propagated, and excluded from the comparisons to avoid invalid value warnings
+    if invalid == 0 or np.isnan(hurs):
+        return hurs
+    # Selections rather than branches, which are mispredicted when many values are invalid
+    if invalid == 1:
+        return min(max(hurs, 0.0), 100.0)
+    return hurs if (hurs >= 0) & (hurs <= 100) else np.nan
+
+
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32, float32, int64, int64, int64)",
+        "float64(float64, float64, float64, float64, float64, int64, int64, int64)",
+    ],
+    cache=True,
+)
+def _relative_humidity_dewpoint(tas, tdps, T_i, T_w, power, mode, method, invalid):  # pragma: no cover
+    """Relative humidity from the temperature and dewpoint (K), see :py:func:`_esat` and :py:func:`_invalid_hurs`."""
+    hurs = 100 * _esat(tdps, T_i, T_w, power, mode, method) / _esat(tas, T_i, T_w, power, mode, method)
+    return _invalid_hurs(hurs, invalid)
+
+
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32, float32, int64, int64)",
+        "float64(float64, float64, float64, float64, float64, int64, int64)",
+    ],
+    cache=True,
+)
+def _vapor_pressure_deficit(tas, hurs, T_i, T_w, power, mode, method):  # pragma: no cover
+    """Vapour pressure deficit from the temperature (K) and relative humidity (%), see :py:func:`_esat`."""
+    return (1 - hurs / 100) * _esat(tas, T_i, T_w, power, mode, method)
+
+
+def _apply_saturation_vapor_pressure(tas: xr.DataArray, method: str, variant: str) -> xr.DataArray:
+    """Saturation vapor pressure of a method, with reference to water or ice."""
+    if method == "ecmwf":
+        method = "buck81" if variant == "water" else "aerk96"
+    if method in ESAT_FORMULAS_COEFFICIENTS:
+        # Few enough operations that numpy's vectorized exponential is faster than a compiled kernel
+        A, B, C = ESAT_FORMULAS_COEFFICIENTS[method][variant]
+        return A * np.exp(B * (tas - 273.16) / (tas + C))
+    valid = ["sonntag90", "goffgratch46", "its90", "ecmwf"] + list(ESAT_FORMULAS_COEFFICIENTS.keys())
+    raise ValueError(f"Method {method} is not in {valid}")
+
+
+def _saturation_vapor_pressure_over_water(tas: xr.DataArray, method: str):
+    """Saturation vapor pressure with reference to water."""
+    return _apply_saturation_vapor_pressure(tas, method, "water")
 
 
 def _saturation_vapor_pressure_over_ice(tas: xr.DataArray, method: str):
     """Saturation vapor pressure with reference to ice."""
-    e_sat: xr.DataArray
-    if method == "ecmwf":
-        method = "aerk96"
-    if method in "sonntag90":
-        e_sat = 100 * np.exp(
-            -6024.5282 / tas  # type: ignore
-            + 24.7219
-            + 1.0613868e-2 * tas  # type: ignore
-            + -1.3198825e-5 * tas**2
-            + -0.49382577 * np.log(tas)
-        )
-    elif method in "goffgratch46":
-        Tp = 273.16  # Triple-point temperature [K]
-        ep = 611.73  # e_sat at Tp [Pa]
-        e_sat = ep * 10 ** (
-            -9.09718 * ((Tp / tas) - 1)  # type: ignore
-            + -3.56654 * np.log10(Tp / tas)  # type: ignore
-            + 0.876793 * (1 - tas / Tp)
-        )
-    elif method in "its90":
-        e_sat = np.exp(
-            -5866.6426 / tas
-            + 22.32870244
-            + 1.39387003e-2 * tas
-            + -3.4262402e-5 * tas**2
-            + 2.7040955e-8 * tas**3
-            + 6.7063522e-1 * np.log(tas)
-        )
-    elif method in ESAT_FORMULAS_COEFFICIENTS:
-        A, B, C = ESAT_FORMULAS_COEFFICIENTS[method]["ice"]
-        e_sat = A * np.exp(B * (tas - 273.16) / (tas + C))
-    else:
-        valid = ["sonntag90", "goffgratch46", "its90", "ecmwf"] + list(ESAT_FORMULAS_COEFFICIENTS.keys())
-        raise ValueError(f"Method {method} is not in {valid}")
-    return e_sat
+    return _apply_saturation_vapor_pressure(tas, method, "ice")
 
 
 @declare_units(tas="[temperature]", ice_thresh="[temperature]", water_thresh="[temperature]")
@@ -553,7 +774,24 @@ def saturation_vapor_pressure(
     method = method.casefold()
 
     tas = convert_units_to(tas, "K")
-    if ice_thresh is None and interp_power is None:
+    if method in _ESAT_METHOD_IDS:
+        # Single pass, only computing the formulas used for each temperature
+        dtype = np.result_type(tas.dtype, np.float32)
+        args = _esat_args(method, ice_thresh, interp_power, water_thresh, dtype)
+        if ice_thresh is None and interp_power is None:
+            # all water, without the unused arguments
+            func, args = _saturation_vapor_pressure_water, args[-1:]
+        else:
+            func = _saturation_vapor_pressure
+        e_sat = xr.apply_ufunc(
+            func,
+            tas,
+            *args,
+            dask="parallelized",
+            output_dtypes=[dtype],
+            keep_attrs=True,
+        )
+    elif ice_thresh is None and interp_power is None:
         # all water
         e_sat = _saturation_vapor_pressure_over_water(tas, method)
     elif ice_thresh is not None and interp_power is None:
@@ -574,6 +812,12 @@ def saturation_vapor_pressure(
     return e_sat
 
 
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], cache=True)
+def _vapor_pressure(ps, huss):  # pragma: no cover
+    """Vapour pressure from the pressure and the specific humidity. See :py:func:`vapor_pressure`."""
+    return ps * huss / (_EPS * (1 + huss * _INV_EPS_M1))
+
+
 @declare_units(huss="[]", ps="[pressure]")
 def vapor_pressure(huss: xr.DataArray, ps: xr.DataArray):
     r"""
@@ -604,8 +848,15 @@ def vapor_pressure(huss: xr.DataArray, ps: xr.DataArray):
     Where :math:`p` is the pressure, :math:`q` is the specific humidity and :math:`\epsilon` us the ratio of the dry air
     gas constant to the water vapor gas constant : :math:`\frac{R_{dry}}{R_{vapor}} = 0.621981`.
     """
-    eps = 0.621981
-    e = ps * huss / (eps * (1 + huss * (1 / eps - 1)))
+    e = xr.apply_ufunc(
+        _vapor_pressure,
+        ps,
+        huss,
+        dask="parallelized",
+        output_dtypes=[np.result_type(ps.dtype, huss.dtype, np.float32)],
+        keep_attrs=False,
+        join="inner",
+    )
     return e.assign_attrs(units=ps.attrs["units"])
 
 
@@ -651,17 +902,54 @@ def vapor_pressure_deficit(
     --------
     saturation_vapor_pressure : Vapour pressure at saturation.
     """
+    hurs = convert_units_to(hurs, "%")
+    if method.casefold() in _ESAT_METHOD_IDS:
+        # Saturation vapor pressure and deficit in a single pass
+        tas = convert_units_to(tas, "K")
+        dtype = np.result_type(tas.dtype, hurs.dtype, np.float32)
+        vpd = xr.apply_ufunc(
+            _vapor_pressure_deficit,
+            tas,
+            hurs,
+            *_esat_args(method.casefold(), ice_thresh, interp_power, water_thresh, dtype),
+            dask="parallelized",
+            output_dtypes=[dtype],
+            keep_attrs=False,
+            join="inner",
+        )
+        return vpd.assign_attrs(units="Pa")
+
     svp = saturation_vapor_pressure(
         tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
     )
-
-    hurs = convert_units_to(hurs, "%")
     vpd = cast(xr.DataArray, (1 - (hurs / 100)) * svp)
 
     vpd = vpd.assign_attrs(units=svp.attrs["units"])
     return vpd
 
 
+@vectorize(["float32(float32, float32, int64)", "float64(float64, float64, int64)"], cache=True)
+def _bohren98(tas, tdps, invalid):  # pragma: no cover
+    """Relative humidity from the temperature and dewpoint (K), "bohren98" method. See :py:func:`relative_humidity`."""
+    L = 2.501e6
+    Rw = 461.5
+    return _invalid_hurs(100 * np.exp(-L * (tas - tdps) / (Rw * tas * tdps)), invalid)
+
+
+@vectorize(["float32(float32, float32, int64)", "float64(float64, float64, int64)"], cache=True)
+def _relative_humidity_ratio(e_sat_dt, e_sat_t, invalid):  # pragma: no cover
+    """Relative humidity from the saturation vapour pressures at the dewpoint and at the temperature."""
+    return _invalid_hurs(100 * e_sat_dt / e_sat_t, invalid)
+
+
+@vectorize(["float32(float32, float32, float32, int64)", "float64(float64, float64, float64, int64)"], cache=True)
+def _relative_humidity_huss(e_sat, huss, ps, invalid):  # pragma: no cover
+    """Relative humidity from the saturation vapour pressure, the specific humidity and the pressure (Pa)."""
+    w = huss / (1 - huss)
+    w_sat = 0.62198 * e_sat / (ps - e_sat)
+    return _invalid_hurs(100 * w / w_sat, invalid)
+
+
 @declare_units(
     tas="[temperature]",
     tdps="[temperature]",
@@ -772,14 +1060,37 @@ def relative_humidity(
     ... )
     """
     hurs: xr.DataArray
+    invalid = {"clip": 1, "mask": 2}.get(invalid_values, 0)
     if method in ("bohren98", "BA90"):
         if tdps is None:
             raise ValueError("To use method 'bohren98' (BA98), dewpoint must be given.")
         tdps = convert_units_to(tdps, "K")
         tas = convert_units_to(tas, "K")
-        L = 2.501e6
-        Rw = (461.5,)
-        hurs = 100 * np.exp(-L * (tas - tdps) / (Rw * tas * tdps))  # type: ignore
+        hurs = xr.apply_ufunc(
+            _bohren98,
+            tas,
+            tdps,
+            invalid,
+            dask="parallelized",
+            output_dtypes=[np.result_type(tas.dtype, tdps.dtype, np.float32)],
+            join="inner",
+            keep_attrs=True,
+        )
+    elif tdps is not None and method.casefold() in _ESAT_METHOD_IDS:
+        # Both saturation vapor pressures and their ratio in a single pass
+        tdps = convert_units_to(tdps, "K")
+        tas = convert_units_to(tas, "K")
+        dtype = np.result_type(tas.dtype, tdps.dtype, np.float32)
+        hurs = xr.apply_ufunc(
+            _relative_humidity_dewpoint,
+            tas,
+            tdps,
+            *_esat_args(method.casefold(), ice_thresh, interp_power, water_thresh, dtype),
+            invalid,
+            dask="parallelized",
+            output_dtypes=[dtype],
+            join="inner",
+        )
     elif tdps is not None:
         e_sat_dt = saturation_vapor_pressure(
             tas=tdps, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
@@ -787,7 +1098,16 @@ def relative_humidity(
         e_sat_t = saturation_vapor_pressure(
             tas=tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
         )
-        hurs = 100 * e_sat_dt / e_sat_t  # type: ignore
+        hurs = xr.apply_ufunc(
+            _relative_humidity_ratio,
+            e_sat_dt,
+            e_sat_t,
+            invalid,
+            dask="parallelized",
+            output_dtypes=[np.result_type(e_sat_dt.dtype, e_sat_t.dtype)],
+            keep_attrs=False,
+            join="inner",
+        )
     elif huss is not None and ps is not None:
         ps = convert_units_to(ps, "Pa")
         huss = convert_units_to(huss, "")
@@ -797,20 +1117,46 @@ def relative_humidity(
             tas=tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
         )
 
-        w = huss / (1 - huss)
-        w_sat = 0.62198 * e_sat / (ps - e_sat)  # type: ignore
-        hurs = 100 * w / w_sat
+        hurs = xr.apply_ufunc(
+            _relative_humidity_huss,
+            e_sat,
+            huss,
+            ps,
+            invalid,
+            dask="parallelized",
+            output_dtypes=[np.result_type(e_sat.dtype, huss.dtype, ps.dtype)],
+            keep_attrs=False,
+            join="inner",
+        )
     else:
         raise ValueError("`huss` and `ps` must be provided if `tdps` is not given.")
 
-    if invalid_values == "clip":
-        hurs = hurs.clip(0, 100)
-    elif invalid_values == "mask":
-        hurs = hurs.where((hurs <= 100) & (hurs >= 0))
     hurs = hurs.assign_attrs(units="%")
     return hurs
 
 
+@vectorize(
+    ["float32(float32, float32, float32, int64)", "float64(float64, float64, float64, int64)"],
+    cache=True,
+)
+def _specific_humidity(e_sat, hurs, ps, invalid):  # pragma: no cover
+    """
+    Specific humidity from the saturation vapour pressure, the relative humidity (fraction) and the pressure (Pa).
+
+    Invalid values are kept (0), clipped to [0, q_sat] (1) or masked (2).
+    """
+    w_sat = _EPS * e_sat / (ps - e_sat)
+    w = w_sat * hurs
+    q = w / (1 + w)
+    # Same as in _invalid_hurs
+    if invalid == 0 or np.isnan(q):
+        return q
+    q_sat = w_sat / (1 + w_sat)
+    if invalid == 1:
+        return min(max(q, 0.0), q_sat)
+    return q if (q >= 0) & (q <= q_sat) else np.nan
+
+
 @declare_units(
     tas="[temperature]", hurs="[]", ps="[pressure]", ice_thresh="[temperature]", water_thresh="[temperature]"
 )
@@ -904,20 +1250,27 @@ def specific_humidity(
         tas=tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
     )
 
-    w_sat = 0.621981 * e_sat / (ps - e_sat)  # type: ignore
-    w = w_sat * hurs
-    q: xr.DataArray = w / (1 + w)
-
-    if invalid_values is not None:
-        q_sat = w_sat / (1 + w_sat)
-        if invalid_values == "clip":
-            q = q.clip(0, q_sat)
-        elif invalid_values == "mask":
-            q = q.where((q <= q_sat) & (q >= 0))
+    q: xr.DataArray = xr.apply_ufunc(
+        _specific_humidity,
+        e_sat,
+        hurs,
+        ps,
+        {"clip": 1, "mask": 2}.get(invalid_values, 0),
+        dask="parallelized",
+        output_dtypes=[np.result_type(e_sat.dtype, hurs.dtype, ps.dtype)],
+        keep_attrs=False,
+        join="inner",
+    )
     q = q.assign_attrs(units="")
     return q
 
 
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], cache=True)
+def _specific_humidity_from_vapor_pressure(e, ps):  # pragma: no cover
+    """Specific humidity from the vapour pressure and the pressure (Pa)."""
+    return _EPS * e / (ps - e * (1 - _EPS))
+
+
 @declare_units(tdps="[temperature]", ps="[pressure]", ice_thresh="[temperature]", water_thresh="[temperature]")
 def specific_humidity_from_dewpoint(
     tdps: xr.DataArray,
@@ -980,17 +1333,42 @@ def specific_humidity_from_dewpoint(
     ...     method="wmo08",
     ... )
     """
-    EPSILON = 0.621981  # molar weight of water vs dry air []
     e = saturation_vapor_pressure(
         tas=tdps, method=method, ice_thresh=ice_thresh, interp_power=interp_power, water_thresh=water_thresh
     )  # vapour pressure [Pa]
     ps = convert_units_to(ps, "Pa")  # total air pressure
 
-    q: xr.DataArray = EPSILON * e / (ps - e * (1 - EPSILON))
+    q: xr.DataArray = xr.apply_ufunc(
+        _specific_humidity_from_vapor_pressure,
+        e,
+        ps,
+        dask="parallelized",
+        output_dtypes=[np.result_type(e.dtype, ps.dtype)],
+        keep_attrs=False,
+        join="inner",
+    )
     q = q.assign_attrs(units="")
     return q
 
 
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32, float32)",
+        "float64(float64, float64, float64, float64, float64)",
+    ],
+    cache=True,
+)
+def _dewpoint_from_specific_humidity(huss, ps, inv_A, inv_B, C):  # pragma: no cover
+    """Dewpoint (K) from the specific humidity and pressure, inverting a Magnus-form formula of coefficients A, B, C."""
+    # To avoid 0 in log below, we mask points with no water vapour at all
+    if not huss > 0:
+        return np.nan
+    e = ps * huss / (_EPS * (1 + huss * _INV_EPS_M1))
+    # The reciprocals of A and B are given, multiplications are cheaper than divisions
+    f = np.log(e * inv_A) * inv_B
+    return (-273.16 - C * f) / (f - 1)
+
+
 @declare_units(huss="[]", ps="[pressure]")
 def dewpoint_from_specific_humidity(
     huss: xr.DataArray, ps: xr.DataArray, method: str = "buck81", variant: str = "water"
@@ -1042,18 +1420,116 @@ def dewpoint_from_specific_humidity(
     To imitate the calculations of ECMWF's IFS (ERA5, ERA5-Land), use ``method='buck81'``
     and ``reference='water'`` (the defaults).
     """
-    # To avoid 0 in log below, we mask points with no water vapour at all
-    huss = huss.where(huss > 0)
-    e = vapor_pressure(huss, ps)
-
     method = method.casefold()
+    dtype = np.result_type(huss.dtype, ps.dtype, np.float32)
     A, B, C = ESAT_FORMULAS_COEFFICIENTS[method][variant]
-
-    f = np.log(e / A) / B
-    tdps = (-273.16 - C * f) / (f - 1)
+    inv_A, inv_B, C = (dtype.type(coef) for coef in (1 / A, 1 / B, C))
+    tdps = xr.apply_ufunc(
+        _dewpoint_from_specific_humidity,
+        huss,
+        ps,
+        inv_A,
+        inv_B,
+        C,
+        dask="parallelized",
+        output_dtypes=[dtype],
+        keep_attrs=False,
+        join="inner",
+    )
     return tdps.assign_attrs(units="K", units_metadata="temperature: on_scale")
 
 
+# Nodes of the "auer" snowfall fraction: -inf, thresh, ..., thresh+6, inf [K above thresh]
+_AUER_NODES = np.concatenate([[-273.15], np.linspace(0, 6, 100, endpoint=False), [6, 1e10]])
+# The polynomial, valid between thresh and thresh + 6 (defined in CLASS), all snow below and none above
+_AUER_FRACTION = np.polyval([0.0202, -0.366, 2.0399, -1.5089, -15.038, 4.6664, 100], _AUER_NODES).clip(0, 100) / 100
+_AUER_FRACTION[0] = 1
+_AUER_FRACTION[-2:] = 0
+
+
+@njit(cache=True)
+def _snowfall_fraction_auer(dtas):  # pragma: no cover
+    """Snowfall fraction from the temperature above the threshold (K), "auer" method."""
+    # NaNs are replaced before the comparisons, which raise invalid value warnings once the loop is vectorized
+    isnan = np.isnan(dtas)
+    d = 0.0 if isnan else dtas
+    if isnan or d < _AUER_NODES[0] or d > _AUER_NODES[-1]:
+        return np.nan
+    # Linear interpolation between the nodes, as done by scipy. The index of the upper node is guessed from the
+    # spacing of the nodes, then adjusted so it is the first node not below d (within the first and last intervals)
+    n = _AUER_NODES.size
+    hi = min(max(int(d / 0.06) + 1, 1), n - 1)
+    while hi > 1 and _AUER_NODES[hi - 1] >= d:
+        hi -= 1
+    while hi < n - 1 and _AUER_NODES[hi] < d:
+        hi += 1
+    slope = (_AUER_FRACTION[hi] - _AUER_FRACTION[hi - 1]) / (_AUER_NODES[hi] - _AUER_NODES[hi - 1])
+    return slope * (d - _AUER_NODES[hi - 1]) + _AUER_FRACTION[hi - 1]
+
+
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], cache=True)
+def _snowfall_auer(pr, dtas):  # pragma: no cover
+    """Snowfall from the precipitation and the temperature above the threshold (K), "auer" method."""
+    return pr * _snowfall_fraction_auer(dtas)
+
+
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], cache=True)
+def _rainfall_auer(pr, dtas):  # pragma: no cover
+    """Rainfall from the precipitation and the temperature above the threshold (K), "auer" method."""
+    return pr - pr * _snowfall_fraction_auer(dtas)
+
+
+def _precipitation_phase_approximation(
+    pr: xr.DataArray, tas: xr.DataArray, thresh: Quantified, method: str, liquid: bool
+) -> xr.DataArray:
+    """Solid (liquid if `liquid`) precipitation, see :py:func:`snowfall_approximation`."""
+    out: xr.DataArray
+    if method == "binary":
+        thresh = convert_units_to(thresh, tas)
+        if liquid:
+            # Same as pr - snowfall, precipitation is liquid where tas is missing and missing values are kept
+            out = pr.where(~(tas <= thresh) | pr.isnull(), 0)
+        else:
+            out = pr.where(tas <= thresh, 0)
+
+    elif method == "brown":
+        if not np.isscalar(thresh):
+            raise ValueError("Non-scalar `thresh` are not allowed with method `brown`.")
+
+        # Freezing point + 2C in the native units
+        thresh_plus_2 = convert_units_to(thresh, "degC") + 2
+        upper = convert_units_to(f"{thresh_plus_2} degC", tas)
+        thresh = convert_units_to(thresh, tas)
+
+        # Snowfall fraction decreasing linearly from 1 at thresh to 0 at thresh + 2°C (in units of tas),
+        # the rainfall fraction is its complement
+        if liquid:
+            fraction = ((tas - thresh) / (upper - thresh)).clip(0, 1)
+        else:
+            fraction = ((upper - tas) / (upper - thresh)).clip(0, 1)
+
+        # Multiply precip by the fraction
+        out = pr * fraction
+
+    elif method == "auer":
+        dtas = convert_units_to(tas, "K") - convert_units_to(thresh, "K")
+
+        out = xr.apply_ufunc(
+            _rainfall_auer if liquid else _snowfall_auer,
+            pr,
+            dtas,
+            dask="parallelized",
+            output_dtypes=[np.result_type(pr.dtype, dtas.dtype, np.float32)],
+            keep_attrs=False,
+            join="inner",
+        )
+
+    else:
+        raise ValueError(f"Method {method} not one of 'binary', 'brown' or 'auer'.")
+
+    return out.assign_attrs(units=pr.attrs["units"])
+
+
 @declare_units(pr="[precipitation]", tas="[temperature]", thresh="[temperature]")
 def snowfall_approximation(
     pr: xr.DataArray,
@@ -1103,52 +1579,7 @@ def snowfall_approximation(
     ----------
     :cite:cts:`verseghy_class_2009,melton_atmosphericvarscalcf90_2019`
     """
-    prsn: xr.DataArray
-    if method == "binary":
-        thresh = convert_units_to(thresh, tas)
-        prsn = pr.where(tas <= thresh, 0)
-
-    elif method == "brown":
-        if not np.isscalar(thresh):
-            raise ValueError("Non-scalar `thresh` are not allowed with method `brown`.")
-
-        # Freezing point + 2C in the native units
-        thresh_plus_2 = convert_units_to(thresh, "degC") + 2
-        upper = convert_units_to(f"{thresh_plus_2} degC", tas)
-        thresh = convert_units_to(thresh, tas)
-
-        # Interpolate fraction over temperature (in units of tas)
-        t = xr.DataArray([-np.inf, thresh, upper, np.inf], dims=("tas",), attrs={"units": "degC"})
-        fraction = xr.DataArray([1.0, 1.0, 0.0, 0.0], dims=("tas",), coords={"tas": t})
-
-        # Multiply precip by snowfall fraction
-        prsn = pr * fraction.interp(tas=tas, method="linear")
-
-    elif method == "auer":
-        dtas = convert_units_to(tas, "K") - convert_units_to(thresh, "K")
-
-        # Create nodes for the snowfall fraction: -inf, thresh, ..., thresh+6, inf [degC]
-        t = np.concatenate([[-273.15], np.linspace(0, 6, 100, endpoint=False), [6, 1e10]])
-        t = xr.DataArray(t, dims="tas", name="tas", coords={"tas": t})
-
-        # The polynomial coefficients, valid between thresh and thresh + 6 (defined in CLASS)
-        coeffs = xr.DataArray(
-            [100, 4.6664, -15.038, -1.5089, 2.0399, -0.366, 0.0202],
-            dims=("degree",),
-            coords={"degree": range(7)},
-        )
-
-        fraction = xr.polyval(t.tas, coeffs).clip(0, 100) / 100
-        fraction[0] = 1
-        fraction[-2:] = 0
-
-        # Convert snowfall fraction coordinates to native tas units
-        prsn = pr * fraction.interp(tas=dtas, method="linear")
-
-    else:
-        raise ValueError(f"Method {method} not one of 'binary', 'brown' or 'auer'.")
-
-    prsn = prsn.assign_attrs(units=pr.attrs["units"])
+    prsn = _precipitation_phase_approximation(pr, tas, thresh, method, liquid=False)
     return prsn
 
 
@@ -1187,11 +1618,10 @@ def rain_approximation(
 
     Notes
     -----
-    This method computes the snowfall approximation and subtracts it from the total
+    This method computes the complement of the snowfall fraction and multiplies it with the total
     precipitation to estimate the liquid rain precipitation.
     """
-    prra: xr.DataArray = pr - snowfall_approximation(pr, tas, thresh=thresh, method=method)
-    prra = prra.assign_attrs(units=pr.attrs["units"])
+    prra = _precipitation_phase_approximation(pr, tas, thresh, method, liquid=True)
     return prra
 
 
@@ -1407,6 +1837,12 @@ def shortwave_upwelling_radiation_from_net_downwelling(rss: xr.DataArray, rsds:
     return rsus
 
 
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], cache=True)
+def _clearness_index(rsds, rtop):  # pragma: no cover
+    """Clearness index from the downwelling and extraterrestrial solar radiation. See :py:func:`clearness_index`."""
+    return 0.0 if rsds == 0 else rsds / rtop
+
+
 @declare_units(rsds="[radiation]")
 def clearness_index(rsds: xr.DataArray) -> xr.DataArray:
     r"""
@@ -1439,8 +1875,16 @@ def clearness_index(rsds: xr.DataArray) -> xr.DataArray:
     """
     rtop = extraterrestrial_solar_radiation(rsds.time, rsds.lat)
     rtop = convert_units_to(rtop, rsds)
-    with xr.set_options(keep_attrs=True):
-        ci = xr.where(rsds != 0, rsds / rtop, 0)
+    # As the ratio, the output takes the name and attributes of rsds
+    ci = xr.apply_ufunc(
+        _clearness_index,
+        rsds,
+        rtop,
+        dask="parallelized",
+        output_dtypes=[np.result_type(rsds.dtype, rtop.dtype, np.float32)],
+        keep_attrs=True,
+        join="inner",
+    )
     ci = ci.assign_attrs(units="")
     return ci
 
@@ -1478,6 +1922,20 @@ def shortwave_downwelling_radiation_from_clearness_index(ci: xr.DataArray) -> xr
     return rsds
 
 
+@vectorize(
+    ["float32(float32, float32, boolean, boolean)", "float64(float64, float64, boolean, boolean)"],
+    cache=True,
+)
+def _wind_chill_index(tas, sfcWind, can, mask_invalid):  # pragma: no cover
+    """Wind chill index from the temperature (°C) and wind speed (km/h). See :py:func:`wind_chill_index`."""
+    if mask_invalid and not ((tas <= 0) if can else (sfcWind > 4.828032 and tas <= 10)):
+        return np.nan
+    if can and sfcWind < 5:
+        return tas + sfcWind * (-1.59 + 0.1345 * tas) / 5
+    V = sfcWind**0.16
+    return 13.12 + 0.6215 * tas - 11.37 * V + 0.3965 * tas * V
+
+
 @declare_units(
     tas="[temperature]",
     sfcWind="[speed]",
@@ -1550,18 +2008,20 @@ def wind_chill_index(
     tas = convert_units_to(tas, "degC")
     sfcWind = convert_units_to(sfcWind, "km/h")
 
-    V = sfcWind**0.16
-    W: xr.DataArray = 13.12 + 0.6215 * tas - 11.37 * V + 0.3965 * tas * V
-
-    if method.upper() == "CAN":
-        W = xr.where(sfcWind < 5, tas + sfcWind * (-1.59 + 0.1345 * tas) / 5, W)
-    elif method.upper() != "US":
+    if method.upper() not in ["US", "CAN"]:
         raise ValueError(f"`method` must be one of 'US' and 'CAN'. Got '{method}'.")
 
-    if mask_invalid:
-        mask = {"CAN": tas <= 0, "US": (sfcWind > 4.828032) & (tas <= 10)}
-        W = W.where(mask[method.upper()])
-
+    W: xr.DataArray = xr.apply_ufunc(
+        _wind_chill_index,
+        tas,
+        sfcWind,
+        method.upper() == "CAN",
+        mask_invalid,
+        dask="parallelized",
+        output_dtypes=[np.result_type(tas.dtype, sfcWind.dtype, np.float32)],
+        keep_attrs=False,
+        join="inner",
+    )
     W = W.assign_attrs(units="degC")
     return W
 
@@ -1612,7 +2072,8 @@ def clausius_clapeyron_scaled_precipitation(
     delta_tas = convert_units_to(delta_tas, "delta_degreeC")
 
     # Calculate scaled precipitation.
-    pr_out: xr.DataArray = pr_baseline * (cc_scale_factor**delta_tas)
+    # As exp(log(a) x) rather than a**x, which is slower with an array exponent
+    pr_out: xr.DataArray = pr_baseline * np.exp(math.log(cc_scale_factor) * delta_tas)
     pr_out = pr_out.assign_attrs(units=pr_baseline.attrs["units"])
     return pr_out
 
@@ -110,11 +110,16 @@ def day_angle(time: xr.DataArray) -> xr.DataArray:
     xr.DataArray, [rad]
         Day angle.
     """
-    if XR2409:
-        decimal_year = time.dt.decimal_year
+    if time.dtype.kind == "M":
+        # Fraction of the year, without the element-wise python loop of the generic decimal year computation
+        year_start = time.astype("datetime64[Y]").astype(time.dtype)
+        # The year length is derived from `is_leap_year`, as `days_in_year` requires xarray >= 2024.09
+        year_fraction = (time - year_start) / np.timedelta64(1, "D") / (365 + time.dt.is_leap_year)
+    elif XR2409:
+        year_fraction = time.dt.decimal_year % 1
     else:
-        decimal_year = _datetime_to_decimal_year(times=time, calendar=time.dt.calendar)
-    return ((decimal_year % 1) * 2 * np.pi).assign_attrs(units="rad")
+        year_fraction = _datetime_to_decimal_year(times=time, calendar=time.dt.calendar) % 1
+    return (year_fraction * 2 * np.pi).assign_attrs(units="rad")
 
 
 def solar_declination(time: xr.DataArray, method="spencer") -> xr.DataArray:
@@ -526,6 +531,11 @@ def day_lengths(
     return day_length_hours
 
 
+def _latitude_band_coefficient(lat_abs: np.ndarray, bounds: list, coefficients: np.ndarray) -> np.ndarray:
+    """Coefficients of the latitude bands given their inclusive upper bounds, the last one applying beyond them."""
+    return coefficients[np.digitize(lat_abs, bounds, right=True)]
+
+
 def huglin_day_length_latitude_coefficient(
     lat: xr.DataArray | str,
     method: Literal["huglin", "interpolated"],
@@ -601,11 +611,19 @@ def huglin_day_length_latitude_coefficient(
 
     lat_abs = abs(lat)
     if method == "huglin":
-        k_f_bounds = [(0, -np.inf, 40), (0.02, 40, 42), (0.03, 42, 44), (0.04, 44, 46), (0.05, 46, 48), (0.06, 48, 50)]
-        k = xr.full_like(lat_abs, _cap_value + 1)
-        for k_f_b in k_f_bounds:
-            cond = (k_f_b[1] < lat_abs) & (lat_abs <= k_f_b[2])
-            k = k.where(~cond, 1 + k_f_b[0])
+        # Upper bounds of the latitude bands and their coefficients, looked up in a single pass.
+        k_f_bounds = [40, 42, 44, 46, 48, 50]
+        k_f = 1 + np.array(
+            [0, 0.02, 0.03, 0.04, 0.05, 0.06, _cap_value], dtype=np.result_type(lat_abs.dtype, np.float32)
+        )
+        k = xr.apply_ufunc(
+            _latitude_band_coefficient,
+            lat_abs,
+            kwargs={"bounds": k_f_bounds, "coefficients": k_f},
+            dask="parallelized",
+            output_dtypes=[k_f.dtype],
+            keep_attrs=True,
+        )
     elif method == "interpolated":
         lat_mask = lat_abs <= 50
         lat_coefficient = 1 + ((lat_abs - 40) / 10).clip(min=0) * 0.06
@@ -758,7 +758,11 @@ def preprocess_standardized_index(da: xr.DataArray, freq: str | None, window: in
         da = da.chunk({"time": -1})
 
     if window > 1:
+        chunks = da.chunksizes
         da = da.rolling(time=window).mean(skipna=False, keep_attrs=True)
+        if uses_dask(da):
+            # The rolling operation may split the chunks of the other dimensions, multiplying the fitting tasks
+            da = da.chunk(chunks)
 
     # The time reduction must be done after the rolling
     da = select_time(da, **indexer)
@@ -266,6 +266,7 @@ class TestAgroclimaticIndices:
 
         out = xci.corn_heat_units(tn, tx, thresh_tasmin="4.44 degC", thresh_tasmax="10 degC")
         np.testing.assert_allclose(out, [0, 0.504, 0, 8.478, 17.454])
+        assert out.name is None
 
     @pytest.mark.parametrize(
         "method, end_date, freq, deg_days, max_deg_days",
@@ -371,6 +372,52 @@ class TestAgroclimaticIndices:
                     np.testing.assert_array_less(bedd[1][3:9], bedd[2][3:9])
                     np.testing.assert_array_less(bedd[2][9], bedd[1][9])
 
+    @pytest.mark.parametrize("use_dask", [False, True])
+    def test_missing_period(self, use_dask):
+        # Periods without data are null, those with data but outside the season are 0
+        time_data = xr.date_range(start="1992-01-01", end="1994-12-31", freq="D", calendar="standard")
+        time_data = time_data[time_data.year != 1993]
+        tn = xr.DataArray(
+            np.full(time_data.size, 10.0),
+            dims=("time",),
+            coords={"time": time_data},
+            name="tasmin",
+            attrs={"units": "degC"},
+        )
+        tx = (tn + 10).rename("tasmax")
+        tx.attrs["units"] = "degC"
+        lat = xr.DataArray(45, attrs={"units": "degrees_north"})
+        if use_dask:
+            tn, tx = tn.chunk(time=100), tx.chunk(time=100)
+
+        bedd = xci.biologically_effective_degree_days(tasmin=tn, tasmax=tx, method="icclim", freq="MS")
+        assert bedd.name is None
+        assert bedd.time.size == 36
+        year = [0, 0, 0, 150, 155, 150, 155, 155, 150, 155, 0, 0]
+        np.testing.assert_array_equal(bedd, year + [np.nan] * 12 + year)
+
+        hi = xci.huglin_index(tas=tn, tasmax=tx, lat=lat, method="huglin", freq="YS")
+        assert hi.time.size == 3
+        assert np.isnan(hi[1])
+        np.testing.assert_allclose(hi[[0, 2]], [951.6, 951.6], rtol=1e-4)
+
+    def test_daily_precision(self, tasmin_series, tasmax_series):
+        # Single precision inputs are not upcast by the daily computations
+        tn = tasmin_series(np.array([-10, 5, 4, 3, 10] * 73, dtype=np.float32) + K2C)
+        tx = tasmax_series(np.array([-5, 9, 10, 16, 20] * 73, dtype=np.float32) + K2C)
+        lat = xr.DataArray(45.0, attrs={"units": "degrees_north"})
+
+        chu = xci.corn_heat_units(tn, tx)
+        assert chu.dtype == np.float32
+        np.testing.assert_allclose(chu[:5], [0, 0.504, 0, 8.478, 17.454], rtol=1e-6, atol=1e-6)
+
+        bedd32 = xci.biologically_effective_degree_days(tasmin=tn, tasmax=tx, lat=lat, method="gladstones", freq="MS")
+        bedd64 = xci.biologically_effective_degree_days(
+            tasmin=tn.astype(np.float64), tasmax=tx.astype(np.float64), lat=lat, method="gladstones", freq="MS"
+        )
+        assert bedd32.dtype == np.float32
+        np.testing.assert_allclose(bedd32, bedd64, rtol=1e-5)
+
     def test_chill_portions(self, tas_series):
         tas = tas_series(np.linspace(0, 15, 120 * 24) + K2C, freq="h")
         out = xci.chill_portions(tas)
@@ -397,6 +444,12 @@ class TestAgroclimaticIndices:
         # Only the last day contains negative chill units.
         assert out[0] == 0.5 * num_cu_05 + num_cu_1 - 0.5 * 3
 
+        # Under dask, the chill units are computed blockwise
+        for positive_only in [False, True]:
+            out_dask = xci.chill_units(tas.chunk(time=7), positive_only=positive_only)
+            assert out_dask.chunks is not None
+            np.testing.assert_array_equal(out_dask, xci.chill_units(tas, positive_only=positive_only))
+
     def test_cool_night_index(self, open_dataset):
         ds = open_dataset("cmip5/tas_Amon_CanESM2_rcp85_r1i1p1_200701-200712.nc")
         ds = ds.rename({"tas": "tasmin"})
@@ -438,6 +491,26 @@ class TestAgroclimaticIndices:
         lti = lti.groupby_bins(lti.lon, 1).mean().groupby_bins(lti.lat, 5).mean()
         np.testing.assert_array_almost_equal(lti[0].squeeze(), np.array(values), 2)
 
+    @pytest.mark.parametrize("use_dask", [False, True])
+    def test_lat_temperature_index_synthetic(self, use_dask):
+        time_data = xr.date_range(start="2000-01-01", end="2002-12-31", freq="D", calendar="standard")
+        time_data = time_data[time_data.year != 2001]
+        lat = xr.DataArray([0, 45, 80], dims=("lat",), attrs={"units": "degrees_north"})
+        # The mean temperature of each month is its number, December is the warmest
+        tas = xr.DataArray(
+            np.tile(time_data.month.values.astype(float), (lat.size, 1)),
+            dims=("lat", "time"),
+            coords={"time": time_data, "lat": lat},
+            attrs={"units": "degC"},
+        )
+        if use_dask:
+            tas = tas.chunk(time=100)
+
+        lti = xci.latitude_temperature_index(tas=tas, lat=lat)
+        assert lti.time.size == 3
+        np.testing.assert_array_equal(lti.isel(time=[0, 2]), [[900, 900], [360, 360], [0, 0]])
+        assert lti.isel(time=1).isnull().all()
+
     @pytest.mark.parametrize(
         "method, end_date, freq, values, cap_value",
         [
@@ -3212,6 +3285,14 @@ def test_saturation_vapor_pressure(tas_series, method, ice_thresh, power, exp0,
     np.testing.assert_allclose(e_sat, e_sat_exp, atol=0.5, rtol=0.005)
 
 
+@pytest.mark.parametrize("ice_thresh", [None, "0 degC"])
+def test_saturation_vapor_pressure_invalid_method(tas_series, ice_thresh):
+    tas = tas_series(np.array([-10, 10]) + K2C)
+    # Partial method names must not match
+    with pytest.raises(ValueError, match="is not in"):
+        xci.saturation_vapor_pressure(tas=tas, method="sonntag", ice_thresh=ice_thresh)
+
+
 def test_vapor_pressure(tas_series, ps_series):
     tas = tas_series(np.array([-1, 10, 20, 25, 30, 40, 60]) + K2C)
     ps = ps_series(np.array([101325] * 7))
@@ -3333,7 +3414,24 @@ def test_snowfall_approximation(pr_series, tasmax_series, method, exp):
     np.testing.assert_allclose(prsn, exp, atol=1e-5, rtol=1e-3)
 
 
-@pytest.mark.parametrize("method,exp", [("binary", [0, 0, 0, 0, 0, 0, 1, 1, 1, 1])])
+def test_snowfall_approximation_auer_upper_bound(pr_series, tas_series):
+    # The polynomial is tabulated every 0.06 K and interpolated linearly down to 0 at thresh + 6 K
+    pr = pr_series(np.ones(4))
+    tas = tas_series(np.array([5.94, 5.97, 6, 6.5]) + 2 + K2C)
+
+    prsn = xci.snowfall_approximation(pr, tas=tas, thresh="2 degC", method="auer")
+
+    np.testing.assert_allclose(prsn, [0.0118532, 0.0059266, 0, 0], atol=1e-7)
+
+
+@pytest.mark.parametrize(
+    "method,exp",
+    [
+        ("binary", [0, 0, 0, 0, 0, 0, 1, 1, 1, 1]),
+        ("brown", [0, 0, 0, 0, 0, 0, 0.5, 1, 1, 1]),
+        ("auer", [0, 0, 0, 0, 0, 0, 0.10195, 0.406708, 0.710634, 0.883376]),
+    ],
+)
 def test_rain_approximation(pr_series, tas_series, method, exp):
     pr = pr_series(np.ones(10))
     tas = tas_series(np.arange(10) + K2C)
@@ -3585,6 +3683,60 @@ def test_rain_season(pr_series, result_type, method_dry_start):
     np.testing.assert_array_equal(out_arr, out_exp)
 
 
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_rain_season_monthly_with_gap(pr_series, use_dask):
+    pr = pr_series(np.full(121, 5.0), start="2000-01-01", units="mm/d")
+    # A wet start followed by a dry end in January and April, no wet start in February, no data in March
+    for first in [0, 91]:
+        pr[{"time": slice(first, first + 3)}] = 10
+        pr[{"time": slice(first + 10, first + 13)}] = 0
+    pr = pr.sel(time=pr.time.dt.month != 3)
+    if use_dask:
+        pr = pr.chunk(time=30)
+    # The wet start is too small for the second threshold
+    thresh_wet_start = xr.DataArray([25, 35], dims=("site",), attrs={"units": "mm"})
+
+    start, end, length = xci.rain_season(
+        pr,
+        thresh_wet_start=thresh_wet_start,
+        window_not_dry_start=5,
+        window_dry_start=3,
+        window_dry_end=3,
+        date_min_start="01-01",
+        date_min_end="01-01",
+        freq="MS",
+    )
+    assert start.dims == ("time", "site")
+    np.testing.assert_array_equal(start.time.dt.month, [1, 2, 3, 4])
+    np.testing.assert_array_equal(start.isel(site=0), [3, np.nan, np.nan, 94])
+    np.testing.assert_array_equal(end.isel(site=0), [11, np.nan, np.nan, 102])
+    np.testing.assert_array_equal(length.isel(site=0), [8, np.nan, np.nan, 8])
+    for out in [start, end, length]:
+        assert out.isel(site=1).isnull().all()
+
+
+def test_rain_season_across_years(pr_series):
+    pr = pr_series(np.zeros(914), start="2000-07-01", units="mm/d")
+    # A season from November to February, the last period ends before the end of the season can be searched
+    pr.loc["2000-11-10":"2001-02-09"] = 5
+    pr.loc["2000-11-10":"2000-11-12"] = 10
+
+    start, end, length = xci.rain_season(
+        pr,
+        date_min_start="11-01",
+        date_max_start="01-31",
+        date_min_end="01-01",
+        date_max_end="06-30",
+        freq="YS-JUL",
+    )
+    np.testing.assert_array_equal(start.time.dt.year, [2000, 2001, 2002])
+    np.testing.assert_array_equal(start, [317, np.nan, np.nan])
+    np.testing.assert_array_equal(end, [41, np.nan, np.nan])
+    np.testing.assert_array_equal(length, [90, np.nan, np.nan])
+    assert start.attrs == end.attrs == {"units": "1", "is_dayofyear": 1}
+    assert length.attrs == {"units": "d"}
+
+
 def test_high_precip_low_temp(pr_series, tasmin_series):
     pr = pr_series([0, 1, 2, 0, 0])
     tas = tasmin_series(np.array([0, 0, 1, 1]) + K2C)
@@ -3924,6 +4076,11 @@ def test_water_budget(pr_series, evspsblpot_series):
     out = xci.water_budget(pr, evspsblpot=pet)
     np.testing.assert_allclose(out, [10 / 86400, 0, -10 / 86400], rtol=1e-5)
 
+    # Single precision precipitation is not upcast
+    out = xci.water_budget(pr.astype(np.float32), evspsblpot=pet)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, [10 / 86400, 0, -10 / 86400], rtol=1e-5)
+
 
 @pytest.mark.parametrize(
     "pr,thresh1,thresh2,window,outs",
@@ -4163,6 +4320,21 @@ def test_mean_radiant_temperature(
     np.testing.assert_allclose(mrt, expected, rtol=1e-03)
 
 
+@pytest.mark.parametrize("keep_attrs", [True, False])
+def test_clearness_index(rsds_series, keep_attrs):
+    rsds = rsds_series(np.array([0, 100, 200]))
+    rsds["lat"] = xr.DataArray(45, attrs={"units": "degrees_north"})
+
+    # The ratio keeps the name and attributes of rsds, whatever the global option
+    with xr.set_options(keep_attrs=keep_attrs):
+        ci = xci.clearness_index(rsds)
+
+    assert ci.name == "rsds"
+    assert ci.attrs["standard_name"] == rsds.attrs["standard_name"]
+    assert ci.attrs["units"] == "1"
+    np.testing.assert_allclose(ci, [0, 0.208402, 0.417315], rtol=1e-5)
+
+
 class TestDrynessIndex:
     def test_dryness_index(self, atmosds):
         ds = atmosds.isel(location=3)
@@ -4176,6 +4348,48 @@ class TestDrynessIndex:
         np.testing.assert_allclose(di, np.array([13.355, 102.426, 65.576, 158.078]), rtol=1e-03)
         np.testing.assert_allclose(di_wet, di_plus_100)
 
+    @staticmethod
+    def _series(start, end, lat):
+        # 1 mm/day of precipitation and no evapotranspiration: the index adds the precipitation of the season to `wo`
+        time = xr.date_range(start, end, freq="D")
+        lat = xr.DataArray(lat, dims=("lat",), attrs={"units": "degrees_north"})
+        pr = xr.DataArray(
+            np.full((time.size, lat.size), 1 / 86400),
+            dims=("time", "lat"),
+            coords={"time": time, "lat": lat},
+            name="pr",
+            attrs={"units": "kg m-2 s-1", "standard_name": "precipitation_flux"},
+        )
+        evspsblpot = xr.zeros_like(pr).rename("evspsblpot").assign_attrs(units="kg m-2 s-1")
+        return pr, evspsblpot
+
+    def test_dryness_index_output(self):
+        pr, evspsblpot = self._series("2001-01-01", "2002-12-31", [45])
+
+        di = xci.dryness_index(pr, evspsblpot)
+        assert di.name is None
+        assert di.attrs == {"units": "mm"}
+        assert di.dims == ("time", "lat")
+        np.testing.assert_allclose(di, [[383], [383]])
+
+    @pytest.mark.parametrize("use_dask", [False, True])
+    def test_dryness_index_hemispheres(self, use_dask):
+        # The series starts and ends in April, the last Southern Hemisphere season (October 2003 to March 2004) is complete
+        pr, evspsblpot = self._series("2000-04-10", "2004-04-09", [-30, 45])
+        if use_dask:
+            pr, evspsblpot = pr.chunk(time=200), evspsblpot.chunk(time=200)
+        south = [200, 382, 382, 382, 383]
+        north = [374, 383, 383, 383, 209]
+
+        di = xci.dryness_index(pr.isel(lat=[0]), evspsblpot.isel(lat=[0]))
+        np.testing.assert_array_equal(di.time.dt.year, [2000, 2001, 2002, 2003, 2004])
+        np.testing.assert_allclose(di.isel(lat=0), south)
+
+        # Both hemispheres share the same years
+        di = xci.dryness_index(pr, evspsblpot)
+        np.testing.assert_array_equal(di.time.dt.year, [2000, 2001, 2002, 2003, 2004])
+        np.testing.assert_allclose(di.transpose("lat", "time"), [south, north])
+
 
 @pytest.mark.parametrize(
     "tmin,meth,zone",